@@ -0,0 +1,298 @@
+# benchmark.py
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from database import Base, User, Vacancy, Resume, ApplicationStatus, WRITE_OPTIONS, create_sqlite_engine, run_migrations, create_search_index
+import feed
+from inbox import inbox_page, employer_application, apply_to_vacancy
+from profiles import save_user_role
+from search import rank_vacancies, rank_candidates
+from seed import SCALES, EMPLOYER_BASE_ID, SEEKER_BASE_ID, scale_counts, seed_database, vacancy_employer_id
+from vacancies import owner_vacancies, delete_vacancy
+
+EMPLOYER_ID = 999999999
+
+# Замість telegram.User для save_user_role
+BenchUser = namedtuple('BenchUser', 'id username full_name')
+
+# Повне читання стрічки на великих масштабах триває секунди, тож його повторюємо менше
+SNAPSHOT_ITERATIONS = 10
+
+def prepare_database(path: str, profile: str, vacancies: int, seekers: int = 0):
+    """Створити порожню базу з усіма міграціями, тестовими вакансіями та резюме кандидатів 0..seekers-1"""
+    bench_engine = create_sqlite_engine(path, profile)
+    Base.metadata.create_all(bench_engine)
+    run_migrations(bench_engine)
+    create_search_index(bench_engine)
+
+    db_session = sessionmaker(bind=bench_engine)()
+    db_session.add_all(
+        Vacancy(
+            title=f"Вакансія {number}",
+            company="Benchmark",
+            description="Опис вакансії для навантажувального тесту",
+            requirements="Python, SQL",
+            employer_id=EMPLOYER_ID
+        )
+        for number in range(vacancies)
+    )
+    db_session.add_all(
+        Resume(
+            user_id=user_id,
+            position="Python розробник",
+            experience="3 роки",
+            education="КПІ",
+            skills="Python, SQL",
+            contacts="Кандидат, +380500000000"
+        )
+        for user_id in range(seekers)
+    )
+    db_session.commit()
+    db_session.close()
+    return bench_engine
+
+def write_throughput(profile: str, writers: int, readers: int, transactions: int, vacancies: int = 50, begin: str = 'immediate'):
+    """Реєстрації та заявки кодом обробників з кількох потоків одночасно, поки інші потоки читають вхідні заявки.
+
+    Кожна транзакція спершу читає, а потім пише, як save_user_role та apply_to_vacancy у боті;
+    begin='deferred' відтворює транзакції без BEGIN IMMEDIATE, що під навантаженням падають з «database is locked».
+    """
+    directory = tempfile.mkdtemp(prefix='workua-bench-')
+    bench_engine = prepare_database(os.path.join(directory, 'bench.db'), profile, vacancies, writers * transactions)
+    BenchSession = sessionmaker(bind=bench_engine, expire_on_commit=False)
+    WriteSession = sessionmaker(
+        bind=bench_engine.execution_options(**WRITE_OPTIONS) if begin == 'immediate' else bench_engine,
+        expire_on_commit=False
+    )
+
+    committed = [0]
+    locked_errors = [0]
+    lock = threading.Lock()
+    writers_done = threading.Event()
+
+    def write(worker: int):
+        db_session = WriteSession()
+        for number in range(transactions):
+            user_id = worker * transactions + number
+            name = f"Кандидат {user_id}"
+            try:
+                save_user_role(db_session, BenchUser(user_id, None, name), False)
+                with lock:
+                    committed[0] += 1
+                apply_to_vacancy(db_session, user_id, random.randint(1, vacancies), name)
+                db_session.commit()
+                with lock:
+                    committed[0] += 1
+            except OperationalError:
+                db_session.rollback()
+                with lock:
+                    locked_errors[0] += 1
+        db_session.close()
+
+    def read():
+        db_session = BenchSession()
+        while not writers_done.is_set():
+            inbox_page(db_session, 'e', EMPLOYER_ID)
+            db_session.rollback()
+        db_session.close()
+
+    reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+    writer_threads = [threading.Thread(target=write, args=(worker,)) for worker in range(writers)]
+    for thread in reader_threads:
+        thread.start()
+
+    started = time.perf_counter()
+    for thread in writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    writers_done.set()
+    for thread in reader_threads:
+        thread.join()
+    bench_engine.dispose()
+
+    return {
+        'profile': profile,
+        'begin': begin,
+        'commits': committed[0],
+        'locked_errors': locked_errors[0],
+        'seconds': round(elapsed, 3),
+        'commits_per_second': round(committed[0] / elapsed, 1),
+    }
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def _timed(work, iterations: int) -> dict:
+    durations = []
+    for number in range(iterations):
+        started = time.perf_counter()
+        work(number)
+        durations.append(time.perf_counter() - started)
+    return {
+        'iterations': iterations,
+        'p50_ms': round(_percentile(durations, 0.5) * 1000, 3),
+        'p95_ms': round(_percentile(durations, 0.95) * 1000, 3),
+        'p99_ms': round(_percentile(durations, 0.99) * 1000, 3),
+        'mean_ms': round(sum(durations) / iterations * 1000, 3),
+    }
+
+def query_patterns(db_session, size: int, rng: random.Random):
+    """Запити bot.py у тому вигляді, як їх виконують обробники: (назва, функція від номера ітерації)"""
+    counts = scale_counts(size)
+    seeker = lambda: SEEKER_BASE_ID + rng.randrange(counts['seekers'])
+    employer = lambda: EMPLOYER_BASE_ID + rng.randrange(counts['employers'])
+    vacancy_ids = iter(rng.sample(range(1, counts['vacancies'] + 1), counts['vacancies']))
+
+    snapshot = feed.load_snapshot(db_session)
+
+    def feed_next(number):
+        card = snapshot.cards[rng.randrange(len(snapshot))]
+        snapshot.older_than((card.created_at, card.id))
+
+    def employer_inbox_detail(number):
+        employer_id = employer()
+        rows, _, _ = inbox_page(db_session, 'e', employer_id)
+        if rows:
+            employer_application(db_session, rows[0][0].id, employer_id)
+
+    def apply(number):
+        apply_to_vacancy(db_session, seeker(), rng.randint(1, counts['vacancies']), "Кандидат")
+        db_session.commit()
+
+    def change_status(number):
+        rows, _, _ = inbox_page(db_session, 'e', employer())
+        if rows:
+            rows[0][0].transition_to(ApplicationStatus.VIEWED)
+            db_session.commit()
+
+    def delete(number):
+        vacancy_id = next(vacancy_ids)
+        delete_vacancy(db_session, vacancy_id, vacancy_employer_id(vacancy_id, counts['employers']))
+        db_session.commit()
+
+    return [
+        ("user_lookup", lambda number: db_session.query(User).filter_by(telegram_id=seeker()).first()),
+        ("feed_snapshot", lambda number: feed.load_snapshot(db_session)),
+        ("feed_next", feed_next),
+        ("search_vacancies", lambda number: rank_vacancies(db_session, rng.choice(['python', 'менеджер', 'senior', 'бухгалтер']), 5)),
+        ("search_candidates", lambda number: rank_candidates(db_session, rng.choice(['django', 'excel', 'figma', 'sql']), 5)),
+        ("seeker_inbox", lambda number: inbox_page(db_session, 's', seeker())),
+        ("employer_inbox", lambda number: inbox_page(db_session, 'e', employer())),
+        ("employer_inbox_unread", lambda number: inbox_page(db_session, 'e', employer(), status=ApplicationStatus.NEW)),
+        ("employer_inbox_detail", employer_inbox_detail),
+        ("employer_vacancies", lambda number: owner_vacancies(db_session, employer())),
+        ("apply", apply),
+        ("change_status", change_status),
+        ("delete_vacancy", delete),
+    ]
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def query_suite(scale: str, profile: str, iterations: int, database: str = None, seed: int = 42) -> dict:
+    """Час кожного шаблону запитів bot.py на синтетичній базі заданого масштабу"""
+    directory = tempfile.mkdtemp(prefix='workua-bench-')
+    path = os.path.join(directory, 'bench.db')
+    if database:
+        # Запити на запис змінюють базу, тож працюємо з копією, щоб прогони були порівнянними
+        shutil.copy(database, path)
+        bench_engine = create_sqlite_engine(path, profile)
+        run_migrations(bench_engine)
+    else:
+        bench_engine = create_sqlite_engine(path, profile)
+        seed_database(bench_engine, SCALES[scale], seed=seed)
+
+    db_session = sessionmaker(bind=bench_engine, expire_on_commit=False)()
+    results = {}
+    for name, work in query_patterns(db_session, SCALES[scale], random.Random(seed)):
+        results[name] = _timed(work, min(iterations, SNAPSHOT_ITERATIONS) if name == 'feed_snapshot' else iterations)
+        db_session.rollback()
+    db_session.close()
+    bench_engine.dispose()
+    shutil.rmtree(directory, ignore_errors=True)
+
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.utcnow().isoformat(timespec='seconds'),
+        'scale': scale,
+        'profile': profile,
+        'iterations': iterations,
+        'patterns': results,
+    }
+
+def print_write_results(results):
+    print("\n📊 Пропускна здатність запису")
+    print("=" * 50)
+    for result in results:
+        print(
+            f"{result['profile']:>8}, BEGIN {result['begin'].upper()}: {result['commits_per_second']:>8} комітів/с, "
+            f"{result['commits']} комітів за {result['seconds']} с, "
+            f"помилок блокування: {result['locked_errors']}"
+        )
+
+    baseline = results[0]['commits_per_second']
+    for result in results[1:]:
+        print(f"🚀 {result['profile']} швидший за {results[0]['profile']} у {result['commits_per_second'] / baseline:.1f} раза")
+
+def print_query_results(result):
+    print(f"\n📊 Запити bot.py: масштаб {result['scale']}, профіль {result['profile']}, коміт {result['commit']}")
+    print("=" * 70)
+    print(f"{'шаблон':<24}{'p50 мс':>10}{'p95 мс':>10}{'p99 мс':>10}{'сер. мс':>10}")
+    for name, timing in result['patterns'].items():
+        print(f"{name:<24}{timing['p50_ms']:>10}{timing['p95_ms']:>10}{timing['p99_ms']:>10}{timing['mean_ms']:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки бази даних WorkUA Helper")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    write_parser = commands.add_parser('write', help="порівняння пропускної здатності запису для профілів SQLite")
+    write_parser.add_argument('--profiles', nargs='+', default=['default', 'tuned'])
+    write_parser.add_argument('--writers', type=int, default=8)
+    write_parser.add_argument('--readers', type=int, default=4)
+    write_parser.add_argument('--transactions', type=int, default=200, help="заявок на один потік запису")
+    write_parser.add_argument('--begin', choices=['immediate', 'deferred'], default='immediate', help="як починаються транзакції запису")
+
+    queries_parser = commands.add_parser('queries', help="час шаблонів запитів bot.py на синтетичних даних")
+    queries_parser.add_argument('--scale', choices=SCALES, default='10k')
+    queries_parser.add_argument('--profile', choices=['default', 'tuned'], default='tuned')
+    queries_parser.add_argument('--iterations', type=int, default=200)
+    queries_parser.add_argument('--database', help="готова база з seed.py того самого масштабу замість генерації")
+    queries_parser.add_argument('--output', help="дописати результат рядком JSON у цей файл для порівняння між комітами")
+    args = parser.parse_args()
+
+    if args.command == 'write':
+        print_write_results([
+            write_throughput(profile, args.writers, args.readers, args.transactions, begin=args.begin)
+            for profile in args.profiles
+        ])
+        return
+
+    result = query_suite(args.scale, args.profile, args.iterations, args.database)
+    print_query_results(result)
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as output:
+            output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        print(f"\n💾 Результат дописано до {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+# check_query_plans.py
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from contextlib import closing
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from config import Config
+from database import (
+    Base, User, Vacancy, Resume, ResumeSnapshot, Application, ApplicationStatus,
+    create_sqlite_engine, run_migrations, create_search_index
+)
+import feed
+from inbox import inbox_page, employer_application, status_counts, change_application_status, count_applications
+from outbox import due_messages
+from profiles import delete_user_data
+from search import rank_vacancies, rank_candidates
+from vacancies import owner_vacancies, employer_stats, delete_vacancy
+
+USER_ID = 999999999
+
+# Скільки SQL-запитів дозволено гарячим шляхам незалежно від кількості заявок (захист від N+1)
+QUERY_BUDGETS = {
+    "inbox_page роботодавця": 3,
+    "employer_application": 1,
+}
+
+def hot_queries(db_session):
+    """Запити обробників bot.py: (назва, функція, що їх виконує); записи відкочуються після кожної перевірки"""
+    cursor = (datetime.utcnow(), 1)
+    return [
+        ("start / профіль: користувач за telegram_id", lambda: db_session.query(User).filter_by(telegram_id=USER_ID).first()),
+        ("feed.active_feed: знімок активної стрічки", lambda: feed.load_snapshot(db_session)),
+        ("search_vacancies", lambda: rank_vacancies(db_session, "python", 9)),
+        ("handle_candidate_search", lambda: rank_candidates(db_session, "python", 7)),
+        ("handle_application_callback: резюме", lambda: db_session.query(Resume).filter_by(user_id=USER_ID).first()),
+        ("handle_application_callback: знімок резюме", lambda: db_session.query(ResumeSnapshot).filter_by(content_hash='0' * 64).first()),
+        ("handle_application_callback: повторна заявка", lambda: db_session.query(Application).filter_by(user_id=USER_ID, vacancy_id=1).first()),
+        ("show_my_applications", lambda: inbox_page(db_session, 's', USER_ID)),
+        ("handle_inbox_callback: старіші заявки шукача", lambda: inbox_page(db_session, 's', USER_ID, 'older', cursor)),
+        ("show_employer_applications", lambda: inbox_page(db_session, 'e', USER_ID)),
+        ("handle_inbox_callback: вкладка «нові»", lambda: inbox_page(db_session, 'e', USER_ID, status=ApplicationStatus.NEW)),
+        ("handle_inbox_callback: старіші у вкладці «переглянуті»", lambda: inbox_page(db_session, 'e', USER_ID, 'older', cursor, status=ApplicationStatus.VIEWED)),
+        ("show_employer_applications: заявки за статусами", lambda: status_counts(db_session, 'e', USER_ID)),
+        ("handle_inbox_callback: новіші заявки роботодавця", lambda: inbox_page(db_session, 'e', USER_ID, 'newer', cursor)),
+        ("handle_inbox_callback: заявка", lambda: employer_application(db_session, 1, USER_ID)),
+        ("handle_application_management", lambda: change_application_status(db_session, 1, USER_ID, "reject")),
+        ("show_my_vacancies", lambda: owner_vacancies(db_session, USER_ID)),
+        ("handle_delete_vacancy_callback", lambda: delete_vacancy(db_session, 1, USER_ID)),
+        ("show_user_profile: роботодавець", lambda: employer_stats(db_session, USER_ID)),
+        ("show_user_profile: шукач", lambda: count_applications(db_session, 's', USER_ID)),
+        ("reset", lambda: delete_user_data(db_session, USER_ID)),
+        ("OutboxWorker: сповіщення до відправки", lambda: due_messages(db_session, 50)),
+    ]
+
+def full_scans(plan_rows):
+    """Кроки плану, що читають таблицю цілком, без індексу"""
+    return [
+        detail for _, _, _, detail in plan_rows
+        if detail.startswith('SCAN') and 'INDEX' not in detail and 'VIRTUAL TABLE' not in detail
+    ]
+
+def captured_statements(engine, run):
+    """SQL-запити (з параметрами), які виконує run()"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        run()
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+    return statements
+
+def _add_employer_applications(db_session, employer_id: int, count: int) -> int:
+    """Вакансія роботодавця з count заявками від різних кандидатів; повертає id першої заявки"""
+    vacancy = Vacancy(title="Python розробник", company="Acme", description="Опис", requirements="Python", employer_id=employer_id)
+    db_session.add_all([User(telegram_id=employer_id, full_name="Роботодавець", is_employer=True), vacancy])
+    db_session.flush()
+    applications = [
+        Application(
+            user_id=employer_id * 100 + number, vacancy_id=vacancy.id, employer_id=employer_id,
+            resume_snapshot=ResumeSnapshot(content_hash=f"{employer_id * 100 + number:064d}", payload='{"v":1}'),
+            created_at=datetime.utcnow() - timedelta(minutes=number)
+        )
+        for number in range(count)
+    ]
+    db_session.add_all(User(telegram_id=application.user_id, full_name=f"Кандидат {number}") for number, application in enumerate(applications))
+    db_session.add_all(applications)
+    db_session.commit()
+    return applications[0].id
+
+def _touch_rows(rows) -> None:
+    """Прочитати знімок резюме, як це робить картка заявки: ліниве довантаження теж потрапить у лічильник"""
+    for application, *_ in rows:
+        application.resume_snapshot and application.resume_snapshot.payload
+
+def check_query_counts() -> bool:
+    """Перевірити, що кількість запитів інбоксу не залежить від кількості заявок"""
+    directory = tempfile.mkdtemp(prefix='workua-plans-')
+    engine = create_sqlite_engine(os.path.join(directory, 'counts.db'))
+    Base.metadata.create_all(engine)
+    run_migrations(engine)
+    db_session = sessionmaker(bind=engine)()
+
+    all_ok = True
+    for applications in (1, 25):
+        employer_id = 1000 + applications
+        application_id = _add_employer_applications(db_session, employer_id, applications)
+        db_session.expunge_all()
+        for name, run in (
+            ("inbox_page роботодавця", lambda: _touch_rows(inbox_page(db_session, 'e', employer_id)[0])),
+            ("employer_application", lambda: _touch_rows([employer_application(db_session, application_id, employer_id)])),
+        ):
+            count = len(captured_statements(engine, run))
+            if count != QUERY_BUDGETS[name]:
+                all_ok = False
+                print(f"❌ {name}, заявок {applications}: {count} запитів замість {QUERY_BUDGETS[name]}")
+            else:
+                print(f"✅ {name}, заявок {applications}: {count} запитів")
+            db_session.expunge_all()
+
+    db_session.close()
+    engine.dispose()
+    shutil.rmtree(directory)
+    return all_ok
+
+def _copy_database(source: str, target: str) -> None:
+    """Копія бази разом із незчекпойнтованим WAL; відсутня база дає порожню копію"""
+    if not os.path.exists(source):
+        return
+    with closing(sqlite3.connect(source)) as source_connection, closing(sqlite3.connect(target)) as target_connection:
+        source_connection.backup(target_connection)
+
+def check_query_plans() -> bool:
+    """Перевірити, що кожен гарячий запит використовує індекс.
+
+    Перевірка йде на копії DATABASE_PATH: міграції й записи гарячих запитів не торкаються робочої бази.
+    """
+    directory = tempfile.mkdtemp(prefix='workua-plans-')
+    path = os.path.join(directory, 'plans.db')
+    _copy_database(Config.DATABASE_PATH, path)
+    engine = create_sqlite_engine(path)
+    Base.metadata.create_all(engine)
+    run_migrations(engine)
+    create_search_index(engine)
+    db_session = sessionmaker(bind=engine)()
+
+    all_ok = True
+    for name, run in hot_queries(db_session):
+        statements = captured_statements(engine, run)
+        db_session.rollback()
+
+        problems = []
+        with engine.connect() as connection:
+            for statement, parameters in statements:
+                plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                problems.extend(full_scans(plan))
+
+        if problems:
+            all_ok = False
+            print(f"❌ {name}: {'; '.join(problems)}")
+        else:
+            print(f"✅ {name}")
+
+    db_session.close()
+    engine.dispose()
+    shutil.rmtree(directory)
+    return all_ok
+
+if __name__ == '__main__':
+    plans_ok = check_query_plans()
+    counts_ok = check_query_counts()
+    sys.exit(0 if plans_ok and counts_ok else 1)
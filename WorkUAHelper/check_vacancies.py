@@ -1,26 +1,155 @@
-# check_vacancies.py
-from database import Session, Vacancy
-
-def check_vacancies():
-    """Перевірити всі вакансії в базі"""
-    db_session = Session()
-    
-    vacancies = db_session.query(Vacancy).all()
-    
-    print(f"📊 Всього вакансій в базі: {len(vacancies)}")
-    print("\n" + "="*50)
-    
-    for i, vacancy in enumerate(vacancies, 1):
-        print(f"\n{i}. 🏢 {vacancy.title}")
-        print(f"   🏭 Компанія: {vacancy.company}")
-        print(f"   💰 Зарплата: {vacancy.salary}")
-        print(f"   👤 Employer ID: {vacancy.employer_id}")
-        print(f"   ✅ Active: {vacancy.is_active}")
-        print(f"   📅 Створено: {vacancy.created_at}")
-        print(f"   📝 Опис: {vacancy.description[:80]}...")
-        print("-" * 50)
-    
-    db_session.close()
-
-if __name__ == '__main__':
-    check_vacancies()
\ No newline at end of file
+# check_vacancies.py
+import argparse
+import csv
+import json
+import sys
+from datetime import datetime, timedelta
+from sqlalchemy import select, func, and_, text, true
+from database import MIGRATIONS, Session, Vacancy
+
+BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = (
+    Vacancy.id, Vacancy.title, Vacancy.company, Vacancy.salary, Vacancy.category,
+    Vacancy.is_active, Vacancy.employer_id, Vacancy.created_at,
+    Vacancy.applications_count, Vacancy.new_applications_count,
+    Vacancy.contacts, Vacancy.description, Vacancy.requirements,
+)
+
+def vacancy_filter(active=None, employer_id=None, since=None, until=None):
+    """Умова WHERE для вибраних фільтрів"""
+    conditions = []
+    if active is not None:
+        conditions.append(Vacancy.is_active == active)
+    if employer_id is not None:
+        conditions.append(Vacancy.employer_id == employer_id)
+    if since:
+        conditions.append(Vacancy.created_at >= since)
+    if until:
+        conditions.append(Vacancy.created_at < until)
+    return and_(true(), *conditions)
+
+def stream_vacancies(db_session, condition, batch_size: int = BATCH_SIZE):
+    """Рядки вакансій пачками по batch_size; у пам'яті ніколи не більше однієї пачки"""
+    statement = select(*EXPORT_COLUMNS).where(condition).order_by(Vacancy.id).execution_options(
+        stream_results=True, yield_per=batch_size
+    )
+    for row in db_session.execute(statement):
+        yield row._asdict()
+
+def vacancy_stats(db_session, condition) -> dict:
+    """Зведена статистика одним агрегатним запитом, без завантаження рядків"""
+    row = db_session.execute(
+        select(
+            func.count(Vacancy.id).label('total'),
+            func.count(Vacancy.id).filter(Vacancy.is_active == True).label('active'),
+            func.count(func.distinct(Vacancy.employer_id)).label('employers'),
+            func.min(Vacancy.created_at).label('first_created_at'),
+            func.max(Vacancy.created_at).label('last_created_at'),
+            func.coalesce(func.sum(Vacancy.applications_count), 0).label('applications'),
+            func.coalesce(func.sum(Vacancy.new_applications_count), 0).label('new_applications'),
+        ).where(condition)
+    ).one()
+    stats = row._asdict()
+
+    stats['top_companies'] = db_session.execute(
+        select(Vacancy.company, func.count(Vacancy.id).label('vacancies')).where(condition).group_by(
+            Vacancy.company
+        ).order_by(func.count(Vacancy.id).desc()).limit(5)
+    ).all()
+    return stats
+
+def write_text(rows, total: int, out) -> None:
+    print(f"📊 Всього вакансій в базі: {total}", file=out)
+    print("\n" + "="*50, file=out)
+
+    for i, vacancy in enumerate(rows, 1):
+        print(f"\n{i}. 🏢 {vacancy['title']}", file=out)
+        print(f"   🏭 Компанія: {vacancy['company']}", file=out)
+        print(f"   💰 Зарплата: {vacancy['salary']}", file=out)
+        print(f"   👤 Employer ID: {vacancy['employer_id']}", file=out)
+        print(f"   ✅ Active: {vacancy['is_active']}", file=out)
+        print(f"   📅 Створено: {vacancy['created_at']}", file=out)
+        print(f"   📝 Опис: {(vacancy['description'] or '')[:80]}...", file=out)
+        print("-" * 50, file=out)
+
+def write_ndjson(rows, out) -> int:
+    count = 0
+    for count, vacancy in enumerate(rows, 1):
+        out.write(json.dumps(vacancy, ensure_ascii=False, default=str) + "\n")
+    return count
+
+def write_csv(rows, out) -> int:
+    writer = csv.DictWriter(out, fieldnames=[column.key for column in EXPORT_COLUMNS])
+    writer.writeheader()
+    count = 0
+    for count, vacancy in enumerate(rows, 1):
+        writer.writerow(vacancy)
+    return count
+
+def print_stats(stats: dict, out) -> None:
+    print("\n📈 Статистика вакансій", file=out)
+    print("=" * 50, file=out)
+    print(f"Всього: {stats['total']}, активних: {stats['active']}, роботодавців: {stats['employers']}", file=out)
+    print(f"Заявок: {stats['applications']}, нових: {stats['new_applications']}", file=out)
+    print(f"Створено: з {stats['first_created_at']} по {stats['last_created_at']}", file=out)
+    if stats['top_companies']:
+        print("Найбільше вакансій: " + ", ".join(f"{company or '—'} ({count})" for company, count in stats['top_companies']), file=out)
+
+def require_migrated(db_session) -> None:
+    """Скрипт лише читає базу: немігровану не чіпаємо, а просимо спершу застосувати міграції"""
+    version = db_session.execute(text("PRAGMA user_version")).scalar()
+    if version < len(MIGRATIONS):
+        raise SystemExit(
+            f"❌ Схема бази застаріла (версія {version} з {len(MIGRATIONS)}): "
+            f"спершу застосуйте міграції командою 'python database.py init'"
+        )
+
+def check_vacancies(args) -> None:
+    """Перевірити вакансії в базі: вивести, експортувати або порахувати статистику"""
+    condition = vacancy_filter(args.active, args.employer, args.since, args.until)
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    # Експорт у stdout не змішуємо з повідомленнями — вони йдуть у stderr
+    report = sys.stderr if args.format != 'text' and not args.output else sys.stdout
+
+    db_session = Session()
+    try:
+        require_migrated(db_session)
+        if args.format == 'text':
+            total = db_session.execute(select(func.count(Vacancy.id)).where(condition)).scalar()
+            write_text(stream_vacancies(db_session, condition, args.batch_size), total, out)
+        elif args.format != 'none':
+            writer = write_ndjson if args.format == 'ndjson' else write_csv
+            count = writer(stream_vacancies(db_session, condition, args.batch_size), out)
+            print(f"✅ Експортовано вакансій: {count}", file=report)
+
+        if args.stats:
+            print_stats(vacancy_stats(db_session, condition), report)
+    finally:
+        db_session.close()
+        if args.output:
+            out.close()
+
+def _date(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+def main():
+    parser = argparse.ArgumentParser(description="Перегляд, експорт і статистика вакансій")
+    state = parser.add_mutually_exclusive_group()
+    state.add_argument('--active', dest='active', action='store_const', const=True, help="лише активні")
+    state.add_argument('--inactive', dest='active', action='store_const', const=False, help="лише неактивні")
+    parser.add_argument('--employer', type=int, help="telegram_id роботодавця")
+    parser.add_argument('--since', type=_date, help="створені не раніше дати (YYYY-MM-DD)")
+    parser.add_argument('--until', type=_date, help="створені до кінця цієї дати включно (YYYY-MM-DD)")
+    parser.add_argument('--format', choices=['text', 'ndjson', 'csv', 'none'], default='text')
+    parser.add_argument('--output', help="файл для експорту замість stdout")
+    parser.add_argument('--stats', action='store_true', help="додати зведену статистику")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.until and args.until.time() == datetime.min.time():
+        args.until += timedelta(days=1)
+    check_vacancies(args)
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,40 @@
-# config.py
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
-class Config:
-    TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
-    ADMIN_IDS = [123456789]  
\ No newline at end of file
+# config.py
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class Config:
+    TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
+    ADMIN_IDS = [123456789]  
+    MAX_CONCURRENT_UPDATES = int(os.getenv('MAX_CONCURRENT_UPDATES', '256'))
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '32'))
+
+    # За замовчуванням база лежить поруч із кодом, а не в поточній теці процесу
+    DATABASE_PATH = os.getenv('DATABASE_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'workua.db'))
+    # Додати тестові вакансії при запуску бота, якщо база порожня
+    SEED_SAMPLE_VACANCIES = os.getenv('SEED_SAMPLE_VACANCIES', '0') == '1'
+    # 'tuned' вмикає WAL та PRAGMA нижче, 'default' залишає налаштування SQLite за замовчуванням
+    SQLITE_PROFILE = os.getenv('SQLITE_PROFILE', 'tuned')
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+    SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv('SQLITE_CACHE_SIZE_KB', '65536'))
+
+    # Кеш профілів користувачів: скільки записів тримати і скільки секунд їм довіряти
+    PROFILE_CACHE_SIZE = int(os.getenv('PROFILE_CACHE_SIZE', '10000'))
+    PROFILE_CACHE_TTL = float(os.getenv('PROFILE_CACHE_TTL', '300'))
+
+    # Кеш готових карток (текст і клавіатура) вакансій та заявок
+    RENDER_CACHE_SIZE = int(os.getenv('RENDER_CACHE_SIZE', '5000'))
+    RENDER_CACHE_TTL = float(os.getenv('RENDER_CACHE_TTL', '600'))
+
+    # Більше SQL-запитів за одне оновлення — попередження в лог
+    QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', '8'))
+
+    # Порт ендпоінта /metrics у форматі Prometheus; 0 — вимкнено
+    METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+    METRICS_PORT = int(os.getenv('METRICS_PORT', '0'))
+
+    # Адреса Bot API; для навантажувальних тестів — фейковий сервер з fake_telegram.py
+    TELEGRAM_BASE_URL = os.getenv('TELEGRAM_BASE_URL', 'https://api.telegram.org/bot')
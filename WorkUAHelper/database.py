@@ -1,187 +1,695 @@
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Boolean, BigInteger, ForeignKey
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from datetime import datetime
-
-Base = declarative_base()
-
-class User(Base):
-    __tablename__ = 'users'
-    
-    id = Column(Integer, primary_key=True)
-    telegram_id = Column(BigInteger, unique=True, nullable=False)
-    username = Column(String(100))
-    full_name = Column(String(200))
-    phone = Column(String(20))
-    email = Column(String(100))
-    is_employer = Column(Boolean, default=False)
-    registration_date = Column(DateTime, default=datetime.utcnow)
-    
-    vacancies = relationship("Vacancy", back_populates="employer")
-    resumes = relationship("Resume", back_populates="user")
-    applications = relationship("Application", back_populates="user")
-
-class Vacancy(Base):
-    __tablename__ = 'vacancies'
-    
-    id = Column(Integer, primary_key=True)
-    title = Column(String(200), nullable=False)
-    company = Column(String(100))
-    salary = Column(String(50))
-    description = Column(Text)
-    requirements = Column(Text)
-    contacts = Column(String(200))
-    category = Column(String(50))
-    is_active = Column(Boolean, default=True)
-    employer_id = Column(BigInteger, ForeignKey('users.telegram_id'))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
-    employer = relationship("User", back_populates="vacancies")
-    applications = relationship("Application", back_populates="vacancy")
-
-class Resume(Base):
-    __tablename__ = 'resumes'
-    
-    id = Column(Integer, primary_key=True)
-    user_id = Column(BigInteger, ForeignKey('users.telegram_id'))
-    position = Column(String(100))
-    salary = Column(String(100))
-    experience = Column(Text, nullable=False)
-    education = Column(Text, nullable=False)
-    skills = Column(Text, nullable=False)
-    about = Column(Text)
-    contacts = Column(String(200))
-    is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
-    user = relationship("User", back_populates="resumes")
-
-class Application(Base):
-    __tablename__ = 'applications'
-    
-    id = Column(Integer, primary_key=True)
-    user_id = Column(BigInteger, ForeignKey('users.telegram_id'), nullable=False)
-    vacancy_id = Column(Integer, ForeignKey('vacancies.id'), nullable=False)
-    employer_id = Column(BigInteger, nullable=False)
-    resume_data = Column(Text)
-    user_contacts = Column(String(500))
-    status = Column(String(20), default="нова")
-    created_at = Column(DateTime, default=datetime.utcnow)
-    
-    user = relationship("User", back_populates="applications")
-    vacancy = relationship("Vacancy", back_populates="applications")
-
-engine = create_engine('sqlite:///workua.db')
-Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
-
-def add_sample_vacancies():
-    """Додати тестові вакансії при створенні бази"""
-    session = Session()
-    
-    existing_vacancies = session.query(Vacancy).count()
-    if existing_vacancies > 0:
-        print("✅ Вакансії вже додані раніше")
-        session.close()
-        return
-    
-    sample_vacancies = [
-        {
-            "title": "Python Developer",
-            "company": "TechSoft Ukraine",
-            "salary": "2500$",
-            "description": "Шукаємо досвідченого Python розробника для роботи над масштабними веб-проектами. Обов'язки: розробка бекенду, інтеграція API, оптимізація продуктивності. Проект: розробка CRM системи для великої компанії.",
-            "requirements": "Досвід роботи з Python 3+ 2+ роки, знання Django/Flask, PostgreSQL, Docker, Git. Англійська - Intermediate+. Знання REST API, ООП, алгоритмів.",
-            "contacts": "HR TechSoft, +380501234567, hr@techsoft.ua",
-            "category": "IT",
-            "employer_id": 999999999,
-            "is_active": True
-        },
-        {
-            "title": "Frontend Developer (React)",
-            "company": "WebInnovations",
-            "salary": "2000$",
-            "description": "Розробка сучасних веб-додатків з використанням React. Участь у створенні UI/UX, робота в команді з дизайнерами та бекенд-розробниками. Робота над міжнародними проектами.",
-            "requirements": "Досвід з React 2+ роки, знання JavaScript/TypeScript, Redux, HTML5/CSS3, SASS. Досвід роботи з REST API, Git. Розуміння принципів адаптивного дизайну.",
-            "contacts": "Recruiter WebInnovations, +380671234567, jobs@webinnovations.com",
-            "category": "IT",
-            "employer_id": 999999999,
-            "is_active": True
-        },
-        {
-            "title": "Full Stack Developer",
-            "company": "StartUpHub",
-            "salary": "3000$",
-            "description": "Повний цикл розробки від ідеї до реалізації. Робота над стартап-проектами в сфері фінтеху. Швидке навчання та кар'єрне зростання. Гнучкий графік, можливість віддаленої роботи.",
-            "requirements": "Python/Django, React/Node.js, бази даних (SQL/NoSQL), Docker, AWS/GCP. Досвід 3+ роки. Здатність працювати в команді, самостійність, креативне мислення.",
-            "contacts": "CEO StartUpHub, +380631234567, founder@starthub.tech",
-            "category": "IT",
-            "employer_id": 999999999,
-            "is_active": True
-        },
-        {
-            "title": "Junior Java Developer",
-            "company": "BankSolutions",
-            "salary": "1200$",
-            "description": "Ідеальна позиція для початківців розробників. Навчання, менторство, робота над банківськими системами. Стабільна компанія, соціальний пакет, корпоративні бенефіти.",
-            "requirements": "Базові знання Java, OOP, SQL, Spring Framework. Бажання вчитися та розвиватися. Англійська - Pre-Intermediate. Логічне мислення, увага до деталей.",
-            "contacts": "HR BankSolutions, +380501112233, career@banksolutions.ua",
-            "category": "IT",
-            "employer_id": 999999999,
-            "is_active": True
-        },
-        {
-            "title": "DevOps Engineer",
-            "company": "CloudSystems",
-            "salary": "3500$",
-            "description": "Робота з хмарною інфраструктурою, автоматизація процесів, CI/CD. Відповідальність за стабільність та безпеку систем. Робота з високонавантаженими системами.",
-            "requirements": "Docker, Kubernetes, AWS/Azure/GCP, Jenkins, Terraform, Ansible. Досвід 3+ роки. Знання Linux адміністрування, мережевих технологій, моніторингу (Prometheus, Grafana).",
-            "contacts": "CTO CloudSystems, +380501234568, tech@cloudsystems.com",
-            "category": "IT",
-            "employer_id": 999999999,
-            "is_active": True
-        },
-        {
-            "title": "Менеджер з продажу",
-            "company": "SalesPro Ukraine",
-            "salary": "15000 грн + бонуси",
-            "description": "Робота з клієнтською базою, пошук нових клієнтів, проведення переговорів, укладання договорів. Робота в дружній команді, корпоративні тренінги.",
-            "requirements": "Досвід роботи в продажах 1+ рік, комунікабельність, цілеспрямованість. Бажання заробляти та розвиватися. Навички ведення переговорів.",
-            "contacts": "HR SalesPro, +380501234569, hr@salespro.ua",
-            "category": "Sales",
-            "employer_id": 999999999,
-            "is_active": True
-        },
-        {
-            "title": "Маркетолог",
-            "company": "DigitalAgency",
-            "salary": "18000 грн",
-            "description": "Розробка маркетингових стратегій, ведення соціальних мереж, створення контент-планів, аналітика ефективності кампаній. Робота з різноманітними клієнтами.",
-            "requirements": "Досвід у маркетингу 1+ рік, знання SMM, Google Analytics, Facebook Ads. Креативність, аналітичне мислення, вміння працювати в команді.",
-            "contacts": "HR DigitalAgency, +380501234570, career@digitalagency.ua",
-            "category": "Marketing",
-            "employer_id": 999999999,
-            "is_active": True
-        }
-    ]
-    
-    for vacancy_data in sample_vacancies:
-        vacancy = Vacancy(
-            title=vacancy_data["title"],
-            company=vacancy_data["company"],
-            salary=vacancy_data["salary"],
-            description=vacancy_data["description"],
-            requirements=vacancy_data["requirements"],
-            contacts=vacancy_data["contacts"],
-            category=vacancy_data["category"],
-            employer_id=vacancy_data["employer_id"],
-            is_active=vacancy_data["is_active"],
-            created_at=datetime.utcnow()
-        )
-        session.add(vacancy)
-    
-    session.commit()
-    session.close()
-    print(f"✅ {len(sample_vacancies)} тестових вакансій успішно додано до бази!")
-
-add_sample_vacancies()
\ No newline at end of file
+import asyncio
+import enum
+import functools
+import hashlib
+import json
+from collections import namedtuple
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Text, DateTime, Boolean, BigInteger, ForeignKey, Index
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker, relationship
+from config import Config
+from datetime import datetime
+
+Base = declarative_base()
+
+class ApplicationStatus(enum.IntEnum):
+    NEW = 0
+    VIEWED = 1
+    REJECTED = 2
+
+    @property
+    def label(self) -> str:
+        return STATUS_LABELS[self]
+
+    @property
+    def badge(self) -> str:
+        return STATUS_BADGES[self]
+
+    def can_become(self, status) -> bool:
+        return status in STATUS_TRANSITIONS[self]
+
+STATUS_LABELS = ("нова", "переглянута", "відхилена")
+STATUS_BADGES = ("🟢", "🟡", "🔴")
+STATUS_TRANSITIONS = {
+    ApplicationStatus.NEW: (ApplicationStatus.VIEWED, ApplicationStatus.REJECTED),
+    ApplicationStatus.VIEWED: (ApplicationStatus.REJECTED,),
+    ApplicationStatus.REJECTED: (),
+}
+
+class StatusType(TypeDecorator):
+    """Статус заявки: у БД мале ціле, у Python — ApplicationStatus"""
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else int(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else ApplicationStatus(value)
+
+class User(Base):
+    __tablename__ = 'users'
+    
+    id = Column(Integer, primary_key=True)
+    telegram_id = Column(BigInteger, unique=True, nullable=False)
+    username = Column(String(100))
+    full_name = Column(String(200))
+    phone = Column(String(20))
+    email = Column(String(100))
+    is_employer = Column(Boolean, default=False)
+    registration_date = Column(DateTime, default=datetime.utcnow)
+    
+    vacancies = relationship("Vacancy", back_populates="employer")
+    resumes = relationship("Resume", back_populates="user")
+    applications = relationship("Application", back_populates="user")
+
+class Vacancy(Base):
+    __tablename__ = 'vacancies'
+    __table_args__ = (
+        Index('ix_vacancies_employer_created', 'employer_id', 'created_at'),
+        Index('ix_vacancies_active_feed', 'created_at', 'id', sqlite_where=text('is_active = 1')),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    title = Column(String(200), nullable=False)
+    company = Column(String(100))
+    salary = Column(String(50))
+    description = Column(Text)
+    requirements = Column(Text)
+    contacts = Column(String(200))
+    category = Column(String(50))
+    is_active = Column(Boolean, default=True)
+    employer_id = Column(BigInteger, ForeignKey('users.telegram_id'))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    applications_count = Column(Integer, nullable=False, default=0, server_default='0')
+    new_applications_count = Column(Integer, nullable=False, default=0, server_default='0')
+    
+    employer = relationship("User", back_populates="vacancies")
+    applications = relationship("Application", back_populates="vacancy")
+
+class Resume(Base):
+    __tablename__ = 'resumes'
+    __table_args__ = (
+        Index('ix_resumes_user_id', 'user_id'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(BigInteger, ForeignKey('users.telegram_id'))
+    position = Column(String(100))
+    salary = Column(String(100))
+    experience = Column(Text, nullable=False)
+    education = Column(Text, nullable=False)
+    skills = Column(Text, nullable=False)
+    about = Column(Text)
+    contacts = Column(String(200))
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    user = relationship("User", back_populates="resumes")
+
+class ResumeSnapshot(Base):
+    __tablename__ = 'resume_snapshots'
+    
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), unique=True, nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class Application(Base):
+    __tablename__ = 'applications'
+    __table_args__ = (
+        Index('uq_applications_user_vacancy', 'user_id', 'vacancy_id', unique=True),
+        Index('ix_applications_user_created', 'user_id', 'created_at'),
+        Index('ix_applications_employer_created', 'employer_id', 'created_at'),
+        Index('ix_applications_vacancy_status', 'vacancy_id', 'status'),
+        Index('ix_applications_employer_status_created', 'employer_id', 'status', 'created_at'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(BigInteger, ForeignKey('users.telegram_id'), nullable=False)
+    vacancy_id = Column(Integer, ForeignKey('vacancies.id'), nullable=False)
+    employer_id = Column(BigInteger, nullable=False)
+    resume_snapshot_id = Column(Integer, ForeignKey('resume_snapshots.id'))
+    user_contacts = Column(String(500))
+    status = Column(StatusType, nullable=False, default=ApplicationStatus.NEW, server_default='0')
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    user = relationship("User", back_populates="applications")
+    vacancy = relationship("Vacancy", back_populates="applications")
+    resume_snapshot = relationship("ResumeSnapshot")
+    
+    def transition_to(self, status: ApplicationStatus) -> bool:
+        """Змінити статус, якщо перехід дозволений; False — статус лишився попереднім"""
+        if not self.status.can_become(status):
+            return False
+        self.status = status
+        return True
+
+class OutboxMessage(Base):
+    __tablename__ = 'outbox'
+    __table_args__ = (
+        Index('ix_outbox_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    idempotency_key = Column(String(200), unique=True, nullable=False)
+    chat_id = Column(BigInteger, nullable=False)
+    text = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime)
+
+RESUME_SNAPSHOT_VERSION = 1
+
+ResumeFields = namedtuple('ResumeFields', 'position experience education skills')
+
+def encode_resume_snapshot(position, experience, education, skills):
+    """(хеш, JSON) знімка резюме; однаковий вміст дає однаковий хеш"""
+    payload = json.dumps(
+        {'v': RESUME_SNAPSHOT_VERSION, 'position': position, 'experience': experience, 'education': education, 'skills': skills},
+        ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest(), payload
+
+def decode_resume_snapshot(snapshot) -> ResumeFields:
+    """Поля знімка резюме заявки; відсутні поля — «Не вказано»"""
+    data = json.loads(snapshot.payload) if snapshot else {}
+    return ResumeFields(*(data.get(field) or "Не вказано" for field in ResumeFields._fields))
+
+def resume_snapshot(db_session, resume) -> ResumeSnapshot:
+    """Знімок резюме для нової заявки; незмінене резюме не дублюється між заявками.
+
+    Вставка з ON CONFLICT не падає, якщо такий самий знімок паралельно записала інша заявка.
+    """
+    content_hash, payload = encode_resume_snapshot(resume.position, resume.experience, resume.education, resume.skills)
+    db_session.execute(
+        insert(ResumeSnapshot).values(
+            content_hash=content_hash,
+            payload=payload
+        ).on_conflict_do_nothing(index_elements=['content_hash'])
+    )
+    return db_session.query(ResumeSnapshot).filter_by(content_hash=content_hash).one()
+
+SEARCH_INDEXES = {
+    'vacancies': ('title', 'company', 'description', 'requirements'),
+    'resumes': ('position', 'skills', 'experience', 'education'),
+}
+
+def _search_index_ddl(table, columns):
+    fts = f"{table}_fts"
+    names = ', '.join(columns)
+    new_values = ', '.join(f"new.{name}" for name in columns)
+    old_values = ', '.join(f"old.{name}" for name in columns)
+    return [
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {names},
+            content='{table}', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} WHEN new.is_active BEGIN
+            INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} WHEN old.is_active BEGIN
+            INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {names}, is_active ON {table} BEGIN
+            INSERT INTO {fts}({fts}, rowid, {names}) SELECT 'delete', old.id, {old_values} WHERE old.is_active;
+            INSERT INTO {fts}(rowid, {names}) SELECT new.id, {new_values} WHERE new.is_active;
+        END
+        """,
+    ]
+
+def create_search_index(engine):
+    """Створити FTS5-індекси вакансій і резюме та тригери синхронізації"""
+    with engine.begin() as connection:
+        for table, columns in SEARCH_INDEXES.items():
+            exists = connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': f"{table}_fts"}
+            ).first()
+            for statement in _search_index_ddl(table, columns):
+                connection.execute(text(statement))
+            if not exists:
+                _fill_search_index(connection, table, columns)
+
+def _fill_search_index(connection, table, columns):
+    fts = f"{table}_fts"
+    names = ', '.join(columns)
+    connection.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('delete-all')"))
+    connection.execute(text(f"INSERT INTO {fts}(rowid, {names}) SELECT id, {names} FROM {table} WHERE is_active"))
+
+def rebuild_search_index():
+    """Перебудувати пошукові індекси для вже наявної бази"""
+    with get_engine().begin() as connection:
+        for table, columns in SEARCH_INDEXES.items():
+            _fill_search_index(connection, table, columns)
+            connection.execute(text(f"INSERT INTO {table}_fts({table}_fts) VALUES ('optimize')"))
+
+NEW_STATUS = int(ApplicationStatus.NEW)
+
+APPLICATION_COUNTER_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_counter_insert AFTER INSERT ON applications BEGIN
+        UPDATE vacancies SET
+            applications_count = applications_count + 1,
+            new_applications_count = new_applications_count + (new.status IS {NEW_STATUS})
+        WHERE id = new.vacancy_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_counter_delete AFTER DELETE ON applications BEGIN
+        UPDATE vacancies SET
+            applications_count = applications_count - 1,
+            new_applications_count = new_applications_count - (old.status IS {NEW_STATUS})
+        WHERE id = old.vacancy_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS applications_counter_update AFTER UPDATE OF status, vacancy_id ON applications BEGIN
+        UPDATE vacancies SET
+            applications_count = applications_count - 1,
+            new_applications_count = new_applications_count - (old.status IS {NEW_STATUS})
+        WHERE id = old.vacancy_id;
+        UPDATE vacancies SET
+            applications_count = applications_count + 1,
+            new_applications_count = new_applications_count + (new.status IS {NEW_STATUS})
+        WHERE id = new.vacancy_id;
+    END
+    """,
+]
+
+def _add_column(connection, table, column_name, column_ddl):
+    columns = [row[1] for row in connection.execute(text(f"PRAGMA table_info({table})"))]
+    if column_name not in columns:
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column_name} {column_ddl}"))
+
+def _migrate_application_counters(connection):
+    """Лічильники заявок у вакансіях, які підтримуються тригерами"""
+    _add_column(connection, 'vacancies', 'applications_count', "INTEGER NOT NULL DEFAULT 0")
+    _add_column(connection, 'vacancies', 'new_applications_count', "INTEGER NOT NULL DEFAULT 0")
+    for statement in APPLICATION_COUNTER_DDL:
+        connection.execute(text(statement))
+    connection.execute(text("""
+        UPDATE vacancies SET
+            applications_count = (SELECT count(*) FROM applications WHERE vacancy_id = vacancies.id),
+            new_applications_count = (SELECT count(*) FROM applications WHERE vacancy_id = vacancies.id AND status = 'нова')
+    """))
+
+# DDL міграцій зафіксовано текстом: індекси, додані в моделі пізніше, створюють їхні власні міграції
+LOOKUP_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_vacancies_employer_created ON vacancies (employer_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_vacancies_active_feed ON vacancies (created_at, id) WHERE is_active = 1",
+    "CREATE INDEX IF NOT EXISTS ix_resumes_user_id ON resumes (user_id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_applications_user_vacancy ON applications (user_id, vacancy_id)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_user_created ON applications (user_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_employer_created ON applications (employer_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_vacancy_status ON applications (vacancy_id, status)",
+]
+
+def _migrate_lookup_indexes(connection):
+    """Індекси для гарячих запитів бота та унікальність заявки (користувач, вакансія)"""
+    connection.execute(text(
+        "DELETE FROM applications WHERE id NOT IN "
+        "(SELECT min(id) FROM applications GROUP BY user_id, vacancy_id)"
+    ))
+    for statement in LOOKUP_INDEX_DDL:
+        connection.execute(text(statement))
+
+OUTBOX_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS outbox (
+        id INTEGER NOT NULL,
+        idempotency_key VARCHAR(200) NOT NULL,
+        chat_id BIGINT NOT NULL,
+        text TEXT NOT NULL,
+        status VARCHAR(20) NOT NULL,
+        attempts INTEGER NOT NULL,
+        next_attempt_at DATETIME,
+        last_error TEXT,
+        created_at DATETIME,
+        sent_at DATETIME,
+        PRIMARY KEY (id),
+        UNIQUE (idempotency_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_outbox_status_next_attempt ON outbox (status, next_attempt_at)",
+]
+
+def _migrate_outbox(connection):
+    """Таблиця outbox для гарантованої доставки сповіщень"""
+    for statement in OUTBOX_DDL:
+        connection.execute(text(statement))
+
+def _migrate_updated_at(connection):
+    """Час останньої зміни вакансій і заявок — частина ключа кешу карток"""
+    for table in ('vacancies', 'applications'):
+        _add_column(connection, table, 'updated_at', "DATETIME")
+        connection.execute(text(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL"))
+
+def _split_legacy_resume_data(resume_data):
+    resume_parts = resume_data.split('|')
+    return [resume_parts[i] if len(resume_parts) > i else None for i in range(4)]
+
+RESUME_SNAPSHOTS_DDL = """
+    CREATE TABLE IF NOT EXISTS resume_snapshots (
+        id INTEGER NOT NULL,
+        content_hash VARCHAR(64) NOT NULL,
+        payload TEXT NOT NULL,
+        created_at DATETIME,
+        PRIMARY KEY (id),
+        UNIQUE (content_hash)
+    )
+"""
+
+def _migrate_resume_snapshots(connection):
+    """Знімки резюме заявок у JSON з дедуплікацією замість resume_data через '|'"""
+    connection.execute(text(RESUME_SNAPSHOTS_DDL))
+    _add_column(connection, 'applications', 'resume_snapshot_id', "INTEGER REFERENCES resume_snapshots(id)")
+    columns = [row[1] for row in connection.execute(text("PRAGMA table_info(applications)"))]
+    if 'resume_data' not in columns:
+        return
+
+    connection.execute(text("CREATE TEMP TABLE legacy_resumes (resume_data TEXT PRIMARY KEY, content_hash TEXT NOT NULL)"))
+    snapshots = []
+    for (resume_data,) in connection.execute(text("SELECT DISTINCT resume_data FROM applications WHERE resume_data IS NOT NULL")).all():
+        content_hash, payload = encode_resume_snapshot(*_split_legacy_resume_data(resume_data))
+        snapshots.append({'resume_data': resume_data, 'content_hash': content_hash, 'payload': payload})
+    if snapshots:
+        connection.execute(text(
+            "INSERT OR IGNORE INTO resume_snapshots (content_hash, payload, created_at) "
+            "VALUES (:content_hash, :payload, CURRENT_TIMESTAMP)"
+        ), snapshots)
+        connection.execute(text("INSERT INTO legacy_resumes VALUES (:resume_data, :content_hash)"), snapshots)
+        connection.execute(text("""
+            UPDATE applications SET resume_snapshot_id = (
+                SELECT resume_snapshots.id FROM legacy_resumes
+                JOIN resume_snapshots ON resume_snapshots.content_hash = legacy_resumes.content_hash
+                WHERE legacy_resumes.resume_data = applications.resume_data
+            ) WHERE resume_data IS NOT NULL
+        """))
+    connection.execute(text("DROP TABLE legacy_resumes"))
+    connection.execute(text("ALTER TABLE applications DROP COLUMN resume_data"))
+
+STATUS_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_applications_vacancy_status ON applications (vacancy_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_applications_employer_status_created ON applications (employer_id, status, created_at)",
+]
+
+def _migrate_status_codes(connection):
+    """Статус заявки — мале ціле замість тексту, індекс (employer_id, status, created_at)"""
+    status_type = next(row[2] for row in connection.execute(text("PRAGMA table_info(applications)")) if row[1] == 'status')
+    # Тригери й індекси, що згадують status, заважають DROP COLUMN — перестворюємо їх після заміни
+    for trigger in ('applications_counter_insert', 'applications_counter_delete', 'applications_counter_update'):
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    if status_type.upper() != 'INTEGER':
+        for index in ('ix_applications_vacancy_status', 'ix_applications_employer_status_created'):
+            connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+        cases = ' '.join(f"WHEN '{label}' THEN {code}" for code, label in enumerate(STATUS_LABELS))
+        _add_column(connection, 'applications', 'status_code', f"INTEGER NOT NULL DEFAULT {NEW_STATUS}")
+        connection.execute(text(f"UPDATE applications SET status_code = CASE status {cases} ELSE {NEW_STATUS} END"))
+        connection.execute(text("ALTER TABLE applications DROP COLUMN status"))
+        connection.execute(text("ALTER TABLE applications RENAME COLUMN status_code TO status"))
+    for statement in STATUS_INDEX_DDL + APPLICATION_COUNTER_DDL:
+        connection.execute(text(statement))
+    connection.execute(text(f"""
+        UPDATE vacancies SET
+            new_applications_count = (SELECT count(*) FROM applications WHERE vacancy_id = vacancies.id AND status = {NEW_STATUS})
+    """))
+
+MIGRATIONS = [
+    _migrate_application_counters,
+    _migrate_lookup_indexes,
+    _migrate_outbox,
+    _migrate_updated_at,
+    _migrate_resume_snapshots,
+    _migrate_status_codes,
+]
+
+def run_migrations(engine):
+    """Застосувати міграції, новіші за PRAGMA user_version бази"""
+    with engine.begin() as connection:
+        version = connection.execute(text("PRAGMA user_version")).scalar()
+        for number, migration in enumerate(MIGRATIONS[version:], version + 1):
+            migration(connection)
+            connection.execute(text(f"PRAGMA user_version = {number}"))
+            print(f"✅ Міграцію {number} застосовано: {migration.__doc__}")
+
+def sqlite_pragmas(profile: str) -> dict:
+    """PRAGMA, які профіль застосовує до кожного нового з'єднання"""
+    if profile == 'default':
+        return {}
+    if profile != 'tuned':
+        raise ValueError(f"Невідомий профіль SQLite: {profile}")
+    return {
+        'journal_mode': 'WAL',
+        'synchronous': Config.SQLITE_SYNCHRONOUS,
+        'busy_timeout': Config.SQLITE_BUSY_TIMEOUT_MS,
+        'mmap_size': Config.SQLITE_MMAP_SIZE,
+        'cache_size': -Config.SQLITE_CACHE_SIZE_KB,
+        'temp_store': 'MEMORY',
+    }
+
+def _apply_pragmas(sync_engine, pragmas):
+    @event.listens_for(sync_engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+def _apply_begin_mode(sync_engine):
+    """BEGIN надсилаємо самі: режим береться з опції з'єднання begin_mode (DEFERRED за замовчуванням)"""
+    @event.listens_for(sync_engine, 'connect')
+    def disable_driver_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(sync_engine, 'begin')
+    def begin(connection):
+        connection.exec_driver_sql(f"BEGIN {connection.get_execution_options().get('begin_mode', 'DEFERRED')}")
+
+# Транзакція «прочитати, потім записати» під WAL не може підняти блокування читання до запису,
+# якщо тим часом закомітив інший писар, і busy_timeout тут не допомагає. BEGIN IMMEDIATE
+# бере блокування запису на початку, тож писарі чекають у черзі, а не падають з «database is locked»
+WRITE_OPTIONS = {'begin_mode': 'IMMEDIATE'}
+
+# Пул на реальну одночасність: читачі паралельно, писар один (див. run_db), решта чекає на з'єднання
+POOL_OPTIONS = {
+    'pool_size': Config.DB_POOL_SIZE,
+    'max_overflow': 0,
+}
+
+def create_sqlite_engine(path: str, profile: str = Config.SQLITE_PROFILE):
+    """Синхронний рушій (міграції, скрипти) з профілем SQLite"""
+    sqlite_engine = create_engine(f'sqlite:///{path}', **POOL_OPTIONS)
+    _apply_pragmas(sqlite_engine, sqlite_pragmas(profile))
+    _apply_begin_mode(sqlite_engine)
+    return sqlite_engine
+
+def create_async_sqlite_engine(path: str, profile: str = Config.SQLITE_PROFILE):
+    """Асинхронний рушій бота (aiosqlite) з тим самим профілем"""
+    sqlite_engine = create_async_engine(f'sqlite+aiosqlite:///{path}', **POOL_OPTIONS)
+    _apply_pragmas(sqlite_engine.sync_engine, sqlite_pragmas(profile))
+    _apply_begin_mode(sqlite_engine.sync_engine)
+    return sqlite_engine
+
+# Рушії створюються при першому зверненні: імпорт модуля не торкається файлу бази
+@functools.lru_cache(maxsize=None)
+def get_engine():
+    return create_sqlite_engine(Config.DATABASE_PATH)
+
+@functools.lru_cache(maxsize=None)
+def get_async_engine():
+    return create_async_sqlite_engine(Config.DATABASE_PATH)
+
+@functools.lru_cache(maxsize=None)
+def _session_factory():
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+@functools.lru_cache(maxsize=None)
+def _async_session_factory(write: bool = False):
+    db_engine = get_async_engine()
+    return async_sessionmaker(db_engine.execution_options(**WRITE_OPTIONS) if write else db_engine, expire_on_commit=False)
+
+def Session():
+    """Синхронна сесія основної бази для скриптів і CLI"""
+    return _session_factory()()
+
+def init_db(seed_samples: bool = False):
+    """Створити таблиці, застосувати міграції та пошукові індекси; за потреби додати тестові вакансії"""
+    db_engine = get_engine()
+    Base.metadata.create_all(db_engine)
+    run_migrations(db_engine)
+    create_search_index(db_engine)
+    if seed_samples:
+        add_sample_vacancies()
+
+# Баланс відкритих і закритих сесій run_db для метрик
+session_counts = {'opened': 0, 'closed': 0}
+
+# Писарі бота по черзі: SQLite все одно пише з одного з'єднання, а так вони не займають пул, чекаючи блокування
+_write_lock = asyncio.Lock()
+WRITE_RETRIES = 3
+WRITE_RETRY_DELAY = 0.05
+
+def is_locked_error(error: OperationalError) -> bool:
+    return 'database is locked' in str(error.orig)
+
+async def _run_session(work, args, write: bool):
+    session_counts['opened'] += 1
+    try:
+        async with _async_session_factory(write)() as db_session:
+            return await db_session.run_sync(work, *args)
+    finally:
+        session_counts['closed'] += 1
+
+async def run_db(work, *args, write: bool = False):
+    """Виконати роботу з БД в асинхронній сесії; запити йдуть через aiosqlite, не блокуючи цикл подій.
+
+    write=True для робіт, що змінюють БД: транзакція починається з BEGIN IMMEDIATE під спільним
+    замком, а якщо базу тримає інший процес довше за busy_timeout — робота повторюється.
+    """
+    if not write:
+        return await _run_session(work, args, False)
+    async with _write_lock:
+        for attempt in range(WRITE_RETRIES):
+            try:
+                return await _run_session(work, args, True)
+            except OperationalError as e:
+                if not is_locked_error(e) or attempt == WRITE_RETRIES - 1:
+                    raise
+                await asyncio.sleep(WRITE_RETRY_DELAY * 2 ** attempt)
+
+def add_sample_vacancies():
+    """Додати тестові вакансії, якщо в базі ще немає жодної"""
+    session = Session()
+    
+    existing_vacancies = session.query(Vacancy).count()
+    if existing_vacancies > 0:
+        print("✅ Вакансії вже додані раніше")
+        session.close()
+        return
+    
+    sample_vacancies = [
+        {
+            "title": "Python Developer",
+            "company": "TechSoft Ukraine",
+            "salary": "2500$",
+            "description": "Шукаємо досвідченого Python розробника для роботи над масштабними веб-проектами. Обов'язки: розробка бекенду, інтеграція API, оптимізація продуктивності. Проект: розробка CRM системи для великої компанії.",
+            "requirements": "Досвід роботи з Python 3+ 2+ роки, знання Django/Flask, PostgreSQL, Docker, Git. Англійська - Intermediate+. Знання REST API, ООП, алгоритмів.",
+            "contacts": "HR TechSoft, +380501234567, hr@techsoft.ua",
+            "category": "IT",
+            "employer_id": 999999999,
+            "is_active": True
+        },
+        {
+            "title": "Frontend Developer (React)",
+            "company": "WebInnovations",
+            "salary": "2000$",
+            "description": "Розробка сучасних веб-додатків з використанням React. Участь у створенні UI/UX, робота в команді з дизайнерами та бекенд-розробниками. Робота над міжнародними проектами.",
+            "requirements": "Досвід з React 2+ роки, знання JavaScript/TypeScript, Redux, HTML5/CSS3, SASS. Досвід роботи з REST API, Git. Розуміння принципів адаптивного дизайну.",
+            "contacts": "Recruiter WebInnovations, +380671234567, jobs@webinnovations.com",
+            "category": "IT",
+            "employer_id": 999999999,
+            "is_active": True
+        },
+        {
+            "title": "Full Stack Developer",
+            "company": "StartUpHub",
+            "salary": "3000$",
+            "description": "Повний цикл розробки від ідеї до реалізації. Робота над стартап-проектами в сфері фінтеху. Швидке навчання та кар'єрне зростання. Гнучкий графік, можливість віддаленої роботи.",
+            "requirements": "Python/Django, React/Node.js, бази даних (SQL/NoSQL), Docker, AWS/GCP. Досвід 3+ роки. Здатність працювати в команді, самостійність, креативне мислення.",
+            "contacts": "CEO StartUpHub, +380631234567, founder@starthub.tech",
+            "category": "IT",
+            "employer_id": 999999999,
+            "is_active": True
+        },
+        {
+            "title": "Junior Java Developer",
+            "company": "BankSolutions",
+            "salary": "1200$",
+            "description": "Ідеальна позиція для початківців розробників. Навчання, менторство, робота над банківськими системами. Стабільна компанія, соціальний пакет, корпоративні бенефіти.",
+            "requirements": "Базові знання Java, OOP, SQL, Spring Framework. Бажання вчитися та розвиватися. Англійська - Pre-Intermediate. Логічне мислення, увага до деталей.",
+            "contacts": "HR BankSolutions, +380501112233, career@banksolutions.ua",
+            "category": "IT",
+            "employer_id": 999999999,
+            "is_active": True
+        },
+        {
+            "title": "DevOps Engineer",
+            "company": "CloudSystems",
+            "salary": "3500$",
+            "description": "Робота з хмарною інфраструктурою, автоматизація процесів, CI/CD. Відповідальність за стабільність та безпеку систем. Робота з високонавантаженими системами.",
+            "requirements": "Docker, Kubernetes, AWS/Azure/GCP, Jenkins, Terraform, Ansible. Досвід 3+ роки. Знання Linux адміністрування, мережевих технологій, моніторингу (Prometheus, Grafana).",
+            "contacts": "CTO CloudSystems, +380501234568, tech@cloudsystems.com",
+            "category": "IT",
+            "employer_id": 999999999,
+            "is_active": True
+        },
+        {
+            "title": "Менеджер з продажу",
+            "company": "SalesPro Ukraine",
+            "salary": "15000 грн + бонуси",
+            "description": "Робота з клієнтською базою, пошук нових клієнтів, проведення переговорів, укладання договорів. Робота в дружній команді, корпоративні тренінги.",
+            "requirements": "Досвід роботи в продажах 1+ рік, комунікабельність, цілеспрямованість. Бажання заробляти та розвиватися. Навички ведення переговорів.",
+            "contacts": "HR SalesPro, +380501234569, hr@salespro.ua",
+            "category": "Sales",
+            "employer_id": 999999999,
+            "is_active": True
+        },
+        {
+            "title": "Маркетолог",
+            "company": "DigitalAgency",
+            "salary": "18000 грн",
+            "description": "Розробка маркетингових стратегій, ведення соціальних мереж, створення контент-планів, аналітика ефективності кампаній. Робота з різноманітними клієнтами.",
+            "requirements": "Досвід у маркетингу 1+ рік, знання SMM, Google Analytics, Facebook Ads. Креативність, аналітичне мислення, вміння працювати в команді.",
+            "contacts": "HR DigitalAgency, +380501234570, career@digitalagency.ua",
+            "category": "Marketing",
+            "employer_id": 999999999,
+            "is_active": True
+        }
+    ]
+    
+    for vacancy_data in sample_vacancies:
+        vacancy = Vacancy(
+            title=vacancy_data["title"],
+            company=vacancy_data["company"],
+            salary=vacancy_data["salary"],
+            description=vacancy_data["description"],
+            requirements=vacancy_data["requirements"],
+            contacts=vacancy_data["contacts"],
+            category=vacancy_data["category"],
+            employer_id=vacancy_data["employer_id"],
+            is_active=vacancy_data["is_active"],
+            created_at=datetime.utcnow()
+        )
+        session.add(vacancy)
+    
+    session.commit()
+    session.close()
+    print(f"✅ {len(sample_vacancies)} тестових вакансій успішно додано до бази!")
+
+if __name__ == '__main__':
+    import sys
+    if sys.argv[1:] == ['init']:
+        init_db()
+        print(f"✅ Базу {Config.DATABASE_PATH} ініціалізовано")
+    elif sys.argv[1:] == ['seed-samples']:
+        init_db(seed_samples=True)
+    elif sys.argv[1:] == ['rebuild-search']:
+        rebuild_search_index()
+        print("✅ Пошукові індекси перебудовано")
\ No newline at end of file
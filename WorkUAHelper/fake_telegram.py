@@ -0,0 +1,160 @@
+# fake_telegram.py
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from urllib.parse import parse_qsl
+
+logger = logging.getLogger(__name__)
+
+BOT_USER = {'id': 1, 'is_bot': True, 'first_name': 'WorkUA Helper', 'username': 'workua_helper_bot'}
+
+class FakeBotAPI:
+    """Локальна заміна Bot API: віддає боту оновлення через getUpdates і збирає його відповіді по чатах"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8081):
+        self.host = host
+        self.port = port
+        self.calls = Counter()
+        self._server = None
+        self._connections = {}
+        self._updates = []
+        self._update_ids = itertools.count(1)
+        self._message_ids = itertools.count(1)
+        self._callback_ids = itertools.count(1)
+        self._callback_chats = {}
+        self._new_updates = asyncio.Event()
+        self._chats = defaultdict(asyncio.Queue)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/bot"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"🤖 Фейковий Bot API: {self.base_url}")
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            for writer in self._connections:
+                writer.close()
+            self._new_updates.set()
+            await asyncio.gather(*self._connections.values(), return_exceptions=True)
+            await self._server.wait_closed()
+
+    def replies(self, chat_id: int) -> asyncio.Queue:
+        """Черга викликів бота, адресованих цьому чату"""
+        return self._chats[chat_id]
+
+    def push_message(self, user: dict, text: str) -> None:
+        message = self._message(user['id'], text, sender=user)
+        if text.startswith('/'):
+            message['entities'] = [{'type': 'bot_command', 'offset': 0, 'length': len(text.split()[0])}]
+        self._push({'message': message})
+
+    def push_callback(self, user: dict, message: dict, data: str) -> None:
+        callback_id = str(next(self._callback_ids))
+        self._callback_chats[callback_id] = user['id']
+        self._push({'callback_query': {
+            'id': callback_id,
+            'from': user,
+            'chat_instance': str(user['id']),
+            'message': message,
+            'data': data,
+        }})
+
+    def _push(self, update: dict) -> None:
+        update['update_id'] = next(self._update_ids)
+        self._updates.append(update)
+        self._new_updates.set()
+
+    def _message(self, chat_id: int, text: str, sender: dict = BOT_USER, message_id: int = None) -> dict:
+        return {
+            'message_id': message_id or next(self._message_ids),
+            'date': int(time.time()),
+            'chat': {'id': chat_id, 'type': 'private'},
+            'from': sender,
+            'text': text,
+        }
+
+    async def get_updates(self, params: dict):
+        offset = int(params.get('offset') or 0)
+        limit = int(params.get('limit') or 100)
+        timeout = float(params.get('timeout') or 0)
+
+        self._updates = [update for update in self._updates if update['update_id'] >= offset]
+        if not self._updates and timeout:
+            self._new_updates.clear()
+            try:
+                await asyncio.wait_for(self._new_updates.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._updates[:limit]
+
+    def _reply(self, method: str, params: dict):
+        if method in ('sendMessage', 'editMessageText', 'editMessageReplyMarkup'):
+            chat_id = int(params['chat_id'])
+            message = self._message(chat_id, params.get('text', ''), message_id=int(params.get('message_id') or 0))
+            # Як і справжній Telegram, у Message повертаємо лише inline-клавіатуру
+            reply_markup = json.loads(params.get('reply_markup', '{}'))
+            if 'inline_keyboard' in reply_markup:
+                message['reply_markup'] = reply_markup
+            self._chats[chat_id].put_nowait((method, message))
+            return message
+        if method == 'deleteMessage':
+            chat_id = int(params['chat_id'])
+            self._chats[chat_id].put_nowait((method, self._message(chat_id, '', message_id=int(params['message_id']))))
+            return True
+        if method == 'answerCallbackQuery':
+            chat_id = self._callback_chats.pop(params['callback_query_id'], None)
+            if chat_id is not None:
+                self._chats[chat_id].put_nowait((method, None))
+            return True
+        if method == 'getMe':
+            return BOT_USER
+        return True
+
+    async def _handle(self, reader, writer) -> None:
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line or writer.is_closing():
+                    break
+
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode('latin-1').strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                if headers.get('content-type', '').startswith('application/json'):
+                    params = json.loads(body or b'{}')
+                else:
+                    params = dict(parse_qsl(body.decode('utf-8')))
+
+                method = request_line.decode('latin-1').split()[1].rsplit('/', 1)[-1]
+                self.calls[method] += 1
+                if method == 'getUpdates':
+                    result = await self.get_updates(params)
+                else:
+                    result = self._reply(method, params)
+
+                payload = json.dumps({'ok': True, 'result': result}).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 200 OK\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode('latin-1') + payload
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
@@ -0,0 +1,138 @@
+# feed.py
+import asyncio
+import bisect
+import time
+from collections import namedtuple
+from datetime import datetime
+from database import Vacancy, run_db
+
+# Страховка від змін в обхід бота (скрипти, ручні правки): знімок старший за це перечитується з БД
+SNAPSHOT_MAX_AGE = 300
+
+TEST_EMPLOYER_ID = 999999999
+
+FeedCard = namedtuple('FeedCard', 'id created_at updated_at text')
+
+class FeedSnapshot:
+    """Незмінний знімок активної стрічки: картки від найстарішої до найновішої, спільні для всіх читачів"""
+
+    def __init__(self, version: int, cards, built_at: float = None):
+        self.version = version
+        self.cards = tuple(cards)
+        self.keys = tuple((card.created_at, card.id) for card in self.cards)
+        # Вік рахується від читання з БД: зміни через бота його не скидають, інакше SNAPSHOT_MAX_AGE не спрацює
+        self.built_at = time.monotonic() if built_at is None else built_at
+        # Клавіатури карток за id: номер і кількість у них залежать від знімка, тож кеш зникає разом із ним
+        self.markups = {}
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def _at(self, index: int):
+        """Картка та її номер у стрічці (1 — найновіша)"""
+        return self.cards[index], len(self.cards) - index
+
+    def newest(self):
+        return self._at(len(self.cards) - 1) if self.cards else (None, 0)
+
+    def older_than(self, cursor):
+        """Наступна (старіша) картка після курсора; з кінця стрічки повертаємось на початок"""
+        if not self.cards:
+            return None, 0
+        index = bisect.bisect_left(self.keys, cursor) - 1
+        return self._at(index if index >= 0 else len(self.cards) - 1)
+
+    def newer_than(self, cursor):
+        """Попередня (новіша) картка перед курсором; з початку стрічки переходимо в кінець"""
+        if not self.cards:
+            return None, 0
+        index = bisect.bisect_right(self.keys, cursor)
+        return self._at(index if index < len(self.cards) else 0)
+
+    def with_card(self, version: int, card: FeedCard) -> 'FeedSnapshot':
+        cards = [existing for existing in self.cards if existing.id != card.id]
+        keys = [(existing.created_at, existing.id) for existing in cards]
+        cards.insert(bisect.bisect_left(keys, (card.created_at, card.id)), card)
+        return FeedSnapshot(version, cards, self.built_at)
+
+    def without(self, version: int, vacancy_ids) -> 'FeedSnapshot':
+        vacancy_ids = set(vacancy_ids)
+        return FeedSnapshot(version, (card for card in self.cards if card.id not in vacancy_ids), self.built_at)
+
+_feed = {'snapshot': None, 'version': 0}
+# Одночасні читачі застарілого знімка чекають на одне читання з БД замість власного кожен
+_reload_lock = asyncio.Lock()
+
+CARD_COLUMNS = (
+    Vacancy.id, Vacancy.created_at, Vacancy.updated_at, Vacancy.title, Vacancy.company, Vacancy.salary,
+    Vacancy.description, Vacancy.requirements, Vacancy.employer_id,
+)
+
+def render_card(vacancy) -> str:
+    test_marker = "🧪 " if vacancy.employer_id == TEST_EMPLOYER_ID else ""
+    return (
+        f"{test_marker}🏢 {vacancy.title}\n"
+        f"🏭 Компанія: {vacancy.company}\n"
+        f"💰 Зарплата: {vacancy.salary or 'Не вказано'}\n"
+        f"📝 Опис: {vacancy.description}\n"
+        f"🎯 Вимоги: {vacancy.requirements}\n"
+        f"────────────────────"
+    )
+
+def feed_card(vacancy) -> FeedCard:
+    return FeedCard(vacancy.id, vacancy.created_at, vacancy.updated_at, render_card(vacancy))
+
+def load_snapshot(db_session, version: int = 0) -> FeedSnapshot:
+    """Зібрати знімок з БД одним проходом по частковому індексу активних вакансій"""
+    # Лише потрібні колонки: без ORM-об'єктів збирання знімка в кілька разів швидше
+    vacancies = _active_vacancies(db_session).with_entities(*CARD_COLUMNS).order_by(Vacancy.created_at, Vacancy.id)
+    return FeedSnapshot(version, (feed_card(vacancy) for vacancy in vacancies))
+
+def _is_stale(snapshot) -> bool:
+    return snapshot is None or time.monotonic() - snapshot.built_at > SNAPSHOT_MAX_AGE
+
+async def active_feed() -> FeedSnapshot:
+    """Поточний знімок стрічки; з БД читається вперше, після reset_feed() і коли знімок старший за SNAPSHOT_MAX_AGE"""
+    snapshot = _feed['snapshot']
+    if not _is_stale(snapshot):
+        return snapshot
+    async with _reload_lock:
+        snapshot = _feed['snapshot']
+        if _is_stale(snapshot):
+            version = _feed['version']
+            snapshot = await run_db(load_snapshot, version)
+            # Якщо стрічка змінилась, поки ми читали БД, цей знімок може бути застарілим — не публікуємо його
+            if _feed['version'] == version:
+                _feed['snapshot'] = snapshot
+    return snapshot
+
+def _publish(change) -> None:
+    _feed['version'] += 1
+    if _feed['snapshot'] is not None:
+        _feed['snapshot'] = change(_feed['snapshot'], _feed['version'])
+
+def publish_vacancy(vacancy) -> None:
+    """Додати або оновити вакансію в стрічці після коміту"""
+    if vacancy.is_active:
+        _publish(lambda snapshot, version: snapshot.with_card(version, feed_card(vacancy)))
+    else:
+        withdraw_vacancies([vacancy.id])
+
+def withdraw_vacancies(vacancy_ids) -> None:
+    """Прибрати видалені або деактивовані вакансії зі стрічки після коміту"""
+    _publish(lambda snapshot, version: snapshot.without(version, vacancy_ids))
+
+def reset_feed() -> None:
+    """Відкинути знімок: наступний читач збере його з БД"""
+    _feed['version'] += 1
+    _feed['snapshot'] = None
+
+def encode_cursor(vacancy) -> str:
+    return f"{vacancy.created_at.strftime('%Y%m%d%H%M%S%f')}_{vacancy.id}"
+
+def decode_cursor(value: str):
+    created_at, vacancy_id = value.split('_')
+    return datetime.strptime(created_at, '%Y%m%d%H%M%S%f'), int(vacancy_id)
+
+def _active_vacancies(db_session):
+    return db_session.query(Vacancy).filter(Vacancy.is_active == True)
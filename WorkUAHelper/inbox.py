@@ -0,0 +1,155 @@
+# inbox.py
+from sqlalchemy import func, or_, and_
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from database import User, Vacancy, Resume, Application, ApplicationStatus, resume_snapshot
+import feed
+from outbox import add_notification
+
+INBOX_PAGE_SIZE = 10
+
+def _owner_column(kind: str):
+    """'s' — заявки шукача за user_id, 'e' — заявки на вакансії роботодавця"""
+    return Application.user_id if kind == 's' else Application.employer_id
+
+def _cursor_filter(mode: str, cursor):
+    created_at, application_id = cursor
+    if mode == 'newer':
+        return or_(Application.created_at > created_at, and_(Application.created_at == created_at, Application.id > application_id))
+    if mode == 'at':
+        return or_(Application.created_at < created_at, and_(Application.created_at == created_at, Application.id <= application_id))
+    return or_(Application.created_at < created_at, and_(Application.created_at == created_at, Application.id < application_id))
+
+def _owner_filter(kind: str, owner_id: int, status=None):
+    condition = _owner_column(kind) == owner_id
+    return condition if status is None else and_(condition, Application.status == status)
+
+def status_counts(db_session, kind: str, owner_id: int) -> dict:
+    """Кількість заявок за статусами; для роботодавця рахується лише за індексом (employer_id, status, created_at)"""
+    return dict(
+        db_session.query(Application.status, func.count(Application.id)).filter(
+            _owner_filter(kind, owner_id)
+        ).group_by(Application.status).all()
+    )
+
+def inbox_page(db_session, kind: str, owner_id: int, mode: str = 'older', cursor=None, limit: int = INBOX_PAGE_SIZE, status=None):
+    """Сторінка вхідних заявок від найновіших, з курсором (created_at, id).
+
+    mode: 'older' — після курсора, 'newer' — перед курсором, 'at' — починаючи з курсора.
+    status — лише заявки з цим статусом (вкладки «нові», «переглянуті» тощо).
+    Повертає (рядки, заявок за статусами, номер першого рядка), де рядок — (заявка, вакансія, ім'я кандидата).
+    """
+    owner = _owner_filter(kind, owner_id, status)
+    query = db_session.query(Application, Vacancy, User.full_name).outerjoin(
+        Vacancy, Vacancy.id == Application.vacancy_id
+    ).outerjoin(
+        User, User.telegram_id == Application.user_id
+    ).filter(owner)
+    if kind == 'e':
+        query = query.options(joinedload(Application.resume_snapshot))
+    if cursor:
+        query = query.filter(_cursor_filter(mode, cursor))
+
+    if mode == 'newer':
+        rows = query.order_by(Application.created_at, Application.id).limit(limit).all()[::-1]
+    else:
+        rows = query.order_by(Application.created_at.desc(), Application.id.desc()).limit(limit).all()
+
+    counts = status_counts(db_session, kind, owner_id)
+    if status is not None:
+        counts = {status: counts.get(status, 0)}
+    if not rows:
+        return rows, counts, 1
+
+    first = rows[0][0]
+    newer_count = db_session.query(func.count(Application.id)).filter(
+        owner, _cursor_filter('newer', (first.created_at, first.id))
+    ).scalar()
+    return rows, counts, newer_count + 1
+
+def employer_application(db_session, application_id: int, employer_id: int):
+    """Заявка роботодавця з ім'ям кандидата або (None, None), якщо вона не його"""
+    row = db_session.query(Application, User.full_name).outerjoin(
+        User, User.telegram_id == Application.user_id
+    ).options(
+        joinedload(Application.resume_snapshot)
+    ).filter(
+        Application.id == application_id, Application.employer_id == employer_id
+    ).first()
+    return row if row else (None, None)
+
+def count_applications(db_session, kind: str, owner_id: int) -> int:
+    return db_session.query(func.count(Application.id)).filter(_owner_filter(kind, owner_id)).scalar()
+
+def change_application_status(db_session, application_id: int, employer_id: int, action: str):
+    """Дія роботодавця над його заявкою (viewed, call, message, reject) без commit.
+
+    Повертає (заявка, ім'я кандидата) або (None, None), якщо заявка не його; сповіщення про відмову додається лише при зміні статусу.
+    """
+    application = db_session.query(Application).options(
+        joinedload(Application.resume_snapshot)
+    ).filter(
+        Application.id == application_id, Application.employer_id == employer_id
+    ).first()
+    if not application:
+        return None, None
+
+    if action in ("viewed", "call", "message"):
+        application.transition_to(ApplicationStatus.VIEWED)
+    elif action == "reject" and application.transition_to(ApplicationStatus.REJECTED):
+        vacancy = db_session.query(Vacancy).filter_by(id=application.vacancy_id).first()
+        rejection_message = (
+            f"ℹ️ Інформація про вашу заявку:\n\n"
+            f"🏢 Вакансія: {vacancy.title if vacancy else 'Вакансія'}\n"
+            f"🏭 Компанія: {vacancy.company if vacancy else 'Компанія'}\n"
+            f"📊 Статус: ❌ Відхилено\n\n"
+            f"Дякуємо за вашу заявку! На жаль, наразі ваша кандидатура не підходить для цієї позиції."
+        )
+        add_notification(db_session, f"application-rejected:{feed.encode_cursor(application)}", application.user_id, rejection_message)
+
+    applicant_name = db_session.query(User.full_name).filter_by(telegram_id=application.user_id).scalar()
+    return application, applicant_name or "Користувач"
+
+def apply_to_vacancy(db_session, user_id: int, vacancy_id: int, applicant_name: str):
+    """Подати заявку зі знімком резюме й сповіщенням роботодавцю через outbox.
+
+    Повертає (результат, вакансія), де результат — "created", "exists" або "no_resume"; commit робить викликач.
+    """
+    resume = db_session.query(Resume).filter_by(user_id=user_id).first()
+    if not resume:
+        return "no_resume", None
+
+    if db_session.query(Application.id).filter_by(user_id=user_id, vacancy_id=vacancy_id).first():
+        return "exists", None
+
+    vacancy = db_session.query(Vacancy).filter_by(id=vacancy_id).first()
+    application = Application(
+        user_id=user_id,
+        vacancy_id=vacancy_id,
+        employer_id=vacancy.employer_id,
+        resume_snapshot=resume_snapshot(db_session, resume),
+        user_contacts=resume.contacts,
+        status=ApplicationStatus.NEW,
+        created_at=datetime.utcnow()
+    )
+
+    db_session.add(application)
+    try:
+        db_session.flush()
+    except IntegrityError:
+        db_session.rollback()
+        return "exists", None
+
+    if vacancy.employer_id != feed.TEST_EMPLOYER_ID:
+        employer_message = (
+            f"📨 Нова заявка на вакансію!\n\n"
+            f"🏢 Вакансія: {vacancy.title}\n"
+            f"👤 Кандидат: {applicant_name}\n"
+            f"📄 Резюме: {resume.position}\n"
+            f"📅 Заявка подана: {application.created_at.strftime('%d.%m.%Y %H:%M')}\n\n"
+            f"Перейдіть в '📨 Заявки на вакансії' для перегляду деталей."
+        )
+        add_notification(db_session, f"application-created:{feed.encode_cursor(application)}", vacancy.employer_id, employer_message)
+
+    return "created", vacancy
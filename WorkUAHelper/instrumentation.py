@@ -0,0 +1,154 @@
+# instrumentation.py
+import functools
+import logging
+import time
+from collections import defaultdict, deque
+from contextvars import ContextVar
+from sqlalchemy import event
+from telegram.ext import ConversationHandler
+from telegram.request import HTTPXRequest
+from metrics import Histogram, LATENCY_BUCKETS, STATEMENT_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+# Скільки останніх оновлень кожного обробника враховують перцентилі
+SAMPLES_PER_HANDLER = 2000
+
+class UpdateStats:
+    """Витрати одного оновлення; живе в contextvar і доступна з подій рушія та запитів до Bot API"""
+
+    def __init__(self, handler: str):
+        self.handler = handler
+        self.db_time = 0.0
+        self.statements = 0
+        self.api_calls = 0
+        self.api_time = 0.0
+
+_current = ContextVar('update_stats', default=None)
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+class HandlerMetrics:
+    """Зібрані вимірювання за обробниками та перевірка бюджету SQL-запитів"""
+
+    def __init__(self, query_budget: int):
+        self.query_budget = query_budget
+        self.samples = defaultdict(lambda: deque(maxlen=SAMPLES_PER_HANDLER))
+        self.calls = defaultdict(int)
+        self.over_budget = defaultdict(int)
+        self.durations = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.db_durations = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.statement_counts = defaultdict(lambda: Histogram(STATEMENT_BUCKETS))
+
+    def record(self, stats: UpdateStats, wall_time: float) -> None:
+        self.calls[stats.handler] += 1
+        self.samples[stats.handler].append((wall_time, stats.db_time, stats.api_time, stats.statements, stats.api_calls))
+        self.durations[stats.handler].observe(wall_time)
+        self.db_durations[stats.handler].observe(stats.db_time)
+        self.statement_counts[stats.handler].observe(stats.statements)
+        if stats.statements > self.query_budget:
+            self.over_budget[stats.handler] += 1
+            logger.warning(
+                f"⚠️ {stats.handler}: {stats.statements} SQL-запитів за оновлення (бюджет {self.query_budget})"
+            )
+
+    def summary(self) -> dict:
+        """{обробник: {метрика: (p50, p95, p99)}} за останніми оновленнями"""
+        result = {}
+        for handler, samples in self.samples.items():
+            columns = list(zip(*samples))
+            result[handler] = {
+                name: tuple(_percentile(values, fraction) for fraction in (0.5, 0.95, 0.99))
+                for name, values in zip(('wall', 'db', 'api', 'statements', 'api_calls'), columns)
+            }
+        return result
+
+    def report(self) -> str:
+        lines = ["⏱ Обробники (p50 / p95 / p99):"]
+        for handler, metrics in sorted(self.summary().items()):
+            wall = ' / '.join(f"{value * 1000:.0f}" for value in metrics['wall'])
+            db = ' / '.join(f"{value * 1000:.0f}" for value in metrics['db'])
+            api = ' / '.join(f"{value * 1000:.0f}" for value in metrics['api'])
+            statements = ' / '.join(str(value) for value in metrics['statements'])
+            over = f", понад бюджет: {self.over_budget[handler]}" if self.over_budget[handler] else ""
+            lines.append(
+                f"\n{handler} ({self.calls[handler]}):\n"
+                f"  час {wall} мс, БД {db} мс, Bot API {api} мс\n"
+                f"  SQL {statements}, API {' / '.join(str(value) for value in metrics['api_calls'])}{over}"
+            )
+        return '\n'.join(lines)
+
+def instrument(callback, metrics: HandlerMetrics):
+    """Обгортка обробника: зовнішня міряє оновлення, вкладена (маршрут роутера) лише уточнює назву"""
+    name = callback.__name__
+
+    @functools.wraps(callback)
+    async def wrapper(update, context, *args):
+        stats = _current.get()
+        if stats is not None:
+            stats.handler = name
+            return await callback(update, context, *args)
+
+        stats = UpdateStats(name)
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            return await callback(update, context, *args)
+        finally:
+            _current.reset(token)
+            metrics.record(stats, time.perf_counter() - started)
+
+    return wrapper
+
+def instrument_handlers(handlers, metrics: HandlerMetrics) -> None:
+    """Обгорнути callback кожного обробника, зокрема всередині ConversationHandler"""
+    for handler in handlers:
+        if isinstance(handler, ConversationHandler):
+            instrument_handlers(handler.entry_points, metrics)
+            for state_handlers in handler.states.values():
+                instrument_handlers(state_handlers, metrics)
+            instrument_handlers(handler.fallbacks, metrics)
+        else:
+            handler.callback = instrument(handler.callback, metrics)
+
+def instrument_router(router, metrics: HandlerMetrics) -> None:
+    router.fallback = instrument(router.fallback, metrics)
+    for table in (router.routes, router.input_handlers):
+        for key, callback in table.items():
+            table[key] = instrument(callback, metrics)
+
+def instrument_engine(sync_engine) -> None:
+    """Рахувати SQL-запити та час БД поточного оновлення"""
+
+    @event.listens_for(sync_engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_started'].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_time += elapsed
+
+    @event.listens_for(sync_engine, 'handle_error')
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_started'):
+            connection.info['query_started'].pop()
+
+class InstrumentedRequest(HTTPXRequest):
+    """HTTPXRequest, що рахує виклики Bot API поточного оновлення"""
+
+    async def do_request(self, *args, **kwargs):
+        stats = _current.get()
+        started = time.perf_counter()
+        try:
+            return await super().do_request(*args, **kwargs)
+        finally:
+            if stats is not None:
+                stats.api_calls += 1
+                stats.api_time += time.perf_counter() - started
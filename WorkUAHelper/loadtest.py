@@ -0,0 +1,249 @@
+# loadtest.py
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from fake_telegram import FakeBotAPI
+
+# Після першої відповіді чекаємо стільки, щоб зібрати решту повідомлень кроку
+SETTLE_SECONDS = 0.2
+
+SEEKER_BASE_ID = 10_000_000
+EMPLOYER_BASE_ID = 20_000_000
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class LoadStats:
+    """Затримки кроків від надсилання оновлення до першої відповіді бота"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.timeouts = defaultdict(int)
+        self.flow_errors = defaultdict(int)
+
+    def report(self, seconds: float, api_calls) -> str:
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        lines = [
+            "📊 Навантажувальний тест",
+            "=" * 60,
+            f"Кроків: {len(all_latencies)} за {seconds:.1f} с — {len(all_latencies) / seconds:.1f} оновлень/с",
+        ]
+        if all_latencies:
+            lines.append(
+                f"Затримка: p50 {_percentile(all_latencies, 0.5) * 1000:.0f} мс, "
+                f"p99 {_percentile(all_latencies, 0.99) * 1000:.0f} мс"
+            )
+        lines.append("")
+        lines.append(f"{'крок':<16}{'к-сть':>8}{'p50 мс':>10}{'p99 мс':>10}{'таймаути':>10}")
+        for step in sorted(self.latencies.keys() | self.timeouts.keys()):
+            values = self.latencies[step]
+            p50 = f"{_percentile(values, 0.5) * 1000:.0f}" if values else '-'
+            p99 = f"{_percentile(values, 0.99) * 1000:.0f}" if values else '-'
+            lines.append(f"{step:<16}{len(values):>8}{p50:>10}{p99:>10}{self.timeouts[step]:>10}")
+        if self.flow_errors:
+            lines.append("")
+            lines.append("⚠️ Перервані сценарії: " + ", ".join(f"{name}: {count}" for name, count in self.flow_errors.items()))
+        lines.append("")
+        lines.append("Виклики Bot API: " + ", ".join(f"{method}: {count}" for method, count in sorted(api_calls.items())))
+        return "\n".join(lines)
+
+class FlowError(Exception):
+    pass
+
+class SimulatedUser:
+    """Один користувач Telegram: надсилає оновлення й чекає відповіді у своєму чаті"""
+
+    def __init__(self, api: FakeBotAPI, stats: LoadStats, user_id: int, name: str, timeout: float):
+        self.api = api
+        self.stats = stats
+        self.user = {'id': user_id, 'is_bot': False, 'first_name': name, 'username': f"user{user_id}"}
+        self.timeout = timeout
+        self.replies = api.replies(user_id)
+
+    async def send(self, step: str, text: str, expect: str = None):
+        return await self._exchange(step, lambda: self.api.push_message(self.user, text), expect)
+
+    async def press(self, step: str, message: dict, data: str, expect: str = None):
+        return await self._exchange(step, lambda: self.api.push_callback(self.user, message, data), expect)
+
+    async def _exchange(self, step: str, push, expect: str = None):
+        """Надіслати оновлення й зібрати відповіді; expect — префікс кнопки, без якої крок не завершено"""
+        while not self.replies.empty():
+            self.replies.get_nowait()
+
+        messages = []
+        answered_at = first_message_at = None
+        started = time.perf_counter()
+        push()
+        while True:
+            satisfied = answered_at or first_message_at
+            if expect:
+                satisfied = self.find_button(messages, expect)[1]
+            wait = SETTLE_SECONDS if satisfied else started + self.timeout - time.perf_counter()
+            try:
+                _, message = await asyncio.wait_for(self.replies.get(), max(wait, 0))
+            except asyncio.TimeoutError:
+                if not satisfied:
+                    self.stats.timeouts[step] += 1
+                    raise FlowError(step)
+                break
+
+            # answerCallbackQuery лише прибирає годинник на кнопці, відповіддю вважаємо перше повідомлення
+            if message is None:
+                answered_at = answered_at or time.perf_counter()
+            else:
+                messages.append(message)
+                first_message_at = first_message_at or time.perf_counter()
+
+        self.stats.latencies[step].append((first_message_at or answered_at) - started)
+        return messages
+
+    @staticmethod
+    def find_button(messages, prefix: str):
+        """Повідомлення й callback_data першої inline-кнопки з таким префіксом"""
+        for message in reversed(messages):
+            keyboard = message.get('reply_markup', {}).get('inline_keyboard', [])
+            for row in keyboard:
+                for button in row:
+                    if button.get('callback_data', '').startswith(prefix):
+                        return message, button['callback_data']
+        return None, None
+
+    async def register_contacts(self, role_button: str) -> None:
+        await self.send('start', '/start')
+        await self.send('role', role_button)
+        await self.send('contacts', '📞 Контакти')
+        await self.send('contacts', self.user['first_name'])
+        await self.send('contacts', f"050{self.user['id'] % 10_000_000:07d}")
+        await self.send('contacts', f"user{self.user['id']}@example.com")
+
+async def seeker_flow(user: SimulatedUser, pages: int) -> None:
+    await user.register_contacts('📋 Знайти вакансії')
+
+    await user.send('resume', '📝 Створити резюме')
+    for answer in ('Python розробник', '1500$', '3 роки | Django, PostgreSQL', 'КПІ', 'Python, SQL, Docker', 'Відповідальний'):
+        await user.send('resume', answer)
+    await user.send('resume', 'Так')
+
+    messages = await user.send('browse', '📋 Список вакансій', expect='vacancy_next_')
+    for _ in range(random.randint(1, pages)):
+        message, data = user.find_button(messages, 'vacancy_next_')
+        messages = await user.press('browse', message, data, expect='apply_')
+
+    message, data = user.find_button(messages, 'apply_')
+    await user.press('apply', message, data)
+
+    await user.send('search', '🔍 Пошук вакансій')
+    await user.send('search', random.choice(['python', 'менеджер', 'дизайнер', 'senior']))
+    await user.send('my_applications', '📨 Мої заявки')
+
+async def employer_flow(user: SimulatedUser, rounds: int, pause: float) -> None:
+    await user.register_contacts('📝 Подати вакансію')
+
+    await user.send('vacancy', '📝 Додати вакансію')
+    for answer in (f"Python розробник #{user.user['id']}", 'Acme', '3000$', 'Бекенд на Django', 'Python 3, SQL'):
+        await user.send('vacancy', answer)
+    await user.send('vacancy', 'Так')
+
+    for _ in range(rounds):
+        await asyncio.sleep(pause)
+        messages = await user.send('inbox', '📨 Заявки на вакансії')
+        message, data = user.find_button(messages, 'inbox_app_')
+        if not data:
+            continue
+
+        messages = await user.press('inbox', message, data, expect='viewed_')
+        message, data = user.find_button(messages, 'viewed_')
+        messages = await user.press('status', message, data)
+        if random.random() < 0.3:
+            message, data = user.find_button(messages, 'reject_')
+            if data:
+                await user.press('status', message, data)
+
+async def run_user(flow, stats: LoadStats, *args) -> None:
+    try:
+        await flow(*args)
+    except FlowError as error:
+        stats.flow_errors[str(error)] += 1
+
+def spawn_bot(base_url: str, database_path: str, log_path: str):
+    """Запустити bot.py окремим процесом проти фейкового Bot API та чистої бази"""
+    env = dict(
+        os.environ,
+        TELEGRAM_BOT_TOKEN='123456:LOADTEST',
+        TELEGRAM_BASE_URL=base_url,
+        DATABASE_PATH=database_path,
+        SEED_SAMPLE_VACANCIES='1',
+    )
+    log = open(log_path, 'w')
+    return subprocess.Popen(
+        [sys.executable, 'bot.py'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+
+async def main(args) -> None:
+    api = FakeBotAPI(args.host, args.port)
+    await api.start()
+
+    bot_process = None
+    if not args.external_bot:
+        directory = tempfile.mkdtemp(prefix='workua-load-')
+        log_path = os.path.join(directory, 'bot.log')
+        bot_process = spawn_bot(api.base_url, os.path.join(directory, 'load.db'), log_path)
+        print(f"🤖 Бот запущено, лог: {log_path}")
+
+    while not api.calls['getUpdates']:
+        if bot_process and bot_process.poll() is not None:
+            await api.stop()
+            raise SystemExit(f"❌ Бот завершився з кодом {bot_process.returncode}, див. {log_path}")
+        await asyncio.sleep(0.1)
+
+    stats = LoadStats()
+    employers = [
+        SimulatedUser(api, stats, EMPLOYER_BASE_ID + number, f"Роботодавець {number}", args.timeout)
+        for number in range(args.employers)
+    ]
+    seekers = [
+        SimulatedUser(api, stats, SEEKER_BASE_ID + number, f"Шукач {number}", args.timeout)
+        for number in range(args.seekers)
+    ]
+
+    async def start_later(delay, flow, *flow_args):
+        await asyncio.sleep(delay)
+        await run_user(flow, stats, *flow_args)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(start_later(random.uniform(0, args.ramp_up), employer_flow, user, args.inbox_rounds, args.inbox_pause) for user in employers),
+        *(start_later(random.uniform(0, args.ramp_up), seeker_flow, user, args.pages) for user in seekers),
+    )
+    seconds = time.perf_counter() - started
+
+    print(stats.report(seconds, api.calls))
+
+    if bot_process:
+        bot_process.terminate()
+        bot_process.wait()
+    await api.stop()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Синтетичне навантаження на bot.py через фейковий Bot API")
+    parser.add_argument('--seekers', type=int, default=1000)
+    parser.add_argument('--employers', type=int, default=100)
+    parser.add_argument('--ramp-up', type=float, default=10.0, help="за скільки секунд підключаються всі користувачі")
+    parser.add_argument('--pages', type=int, default=5, help="максимум вакансій, які гортає шукач")
+    parser.add_argument('--inbox-rounds', type=int, default=3)
+    parser.add_argument('--inbox-pause', type=float, default=5.0)
+    parser.add_argument('--timeout', type=float, default=30.0, help="скільки чекати відповіді на один крок")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--external-bot', action='store_true', help="не запускати bot.py, він уже працює з TELEGRAM_BASE_URL")
+    asyncio.run(main(parser.parse_args()))
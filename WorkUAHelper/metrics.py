@@ -0,0 +1,152 @@
+# metrics.py
+import asyncio
+import logging
+from bisect import bisect_left
+from telegram.ext import ConversationHandler
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 4, 8, 16, 32, 64)
+
+class Histogram:
+    """Накопичувальна гістограма у форматі Prometheus; observe — O(log кошиків)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name: str, labels: str):
+        """Рядки _bucket/_sum/_count для мітки labels (без фігурних дужок)"""
+        prefix = f"{labels}," if labels else ""
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield f'{name}_bucket{{{prefix}le="{bound}"}} {total}'
+        yield f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}'
+        yield f'{name}_sum{{{labels}}} {self.sum}'
+        yield f'{name}_count{{{labels}}} {self.count}'
+
+def _header(name: str, kind: str, help_text: str):
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+def _conversation_handlers(handlers):
+    for handler in handlers:
+        if isinstance(handler, ConversationHandler):
+            yield handler
+
+def render(application, engine, session_counts) -> str:
+    """Поточний стан процесу в текстовому форматі Prometheus"""
+    lines = []
+    handler_metrics = application.bot_data.get('metrics')
+    if handler_metrics:
+        handlers = sorted(handler_metrics.calls)
+        lines += _header('workua_updates_total', 'counter', "Оновлення, оброблені кожним обробником")
+        lines += [f'workua_updates_total{{handler="{name}"}} {handler_metrics.calls[name]}' for name in handlers]
+        lines += _header('workua_over_query_budget_total', 'counter', "Оновлення понад бюджет SQL-запитів")
+        lines += [f'workua_over_query_budget_total{{handler="{name}"}} {handler_metrics.over_budget[name]}' for name in handlers]
+        for metric, histograms, help_text in (
+            ('workua_update_duration_seconds', handler_metrics.durations, "Повний час обробки оновлення"),
+            ('workua_update_db_seconds', handler_metrics.db_durations, "Час SQL-запитів за оновлення"),
+            ('workua_update_sql_statements', handler_metrics.statement_counts, "SQL-запитів за оновлення"),
+        ):
+            lines += _header(metric, 'histogram', help_text)
+            for name in handlers:
+                lines += histograms[name].samples(metric, f'handler="{name}"')
+
+    queue = application.bot_data.get('outbound')
+    if queue:
+        stats = queue.stats()
+        lines += _header('workua_outbound_queue_depth', 'gauge', "Повідомлення, що чекають у черзі")
+        lines.append(f"workua_outbound_queue_depth {stats['depth']}")
+        for key, help_text in (
+            ('sent', "Відправлені повідомлення черги"),
+            ('flood_waits', "Відповіді 429 Too Many Requests"),
+            ('retried', "Повторні спроби відправки"),
+            ('failed', "Повідомлення, які не вдалося відправити"),
+        ):
+            lines += _header(f'workua_outbound_{key}_total', 'counter', help_text)
+            lines.append(f"workua_outbound_{key}_total {stats[key]}")
+
+    caches = application.bot_data.get('caches', {})
+    if caches:
+        stats = {name: cache.stats() for name, cache in caches.items()}
+        for key, kind, help_text in (
+            ('hits', 'counter', "Влучання в кеш процесу"),
+            ('misses', 'counter', "Промахи кешу процесу"),
+            ('evictions', 'counter', "Записи, витіснені з кешу через ліміт розміру"),
+            ('size', 'gauge', "Записів у кеші зараз"),
+        ):
+            metric = f'workua_cache_{key}_total' if kind == 'counter' else f'workua_cache_{key}'
+            lines += _header(metric, kind, help_text)
+            lines += [f'{metric}{{cache="{name}"}} {cache_stats[key]}' for name, cache_stats in stats.items()]
+
+    pool = engine.pool
+    lines += _header('workua_db_pool_checked_out', 'gauge', "З'єднання пулу БД, видані зараз")
+    lines.append(f"workua_db_pool_checked_out {pool.checkedout()}")
+    lines += _header('workua_db_pool_size', 'gauge', "Постійний розмір пулу БД")
+    lines.append(f"workua_db_pool_size {pool.size()}")
+    lines += _header('workua_db_sessions_opened_total', 'counter', "Відкриті асинхронні сесії БД")
+    lines.append(f"workua_db_sessions_opened_total {session_counts['opened']}")
+    lines += _header('workua_db_sessions_closed_total', 'counter', "Закриті асинхронні сесії БД")
+    lines.append(f"workua_db_sessions_closed_total {session_counts['closed']}")
+
+    lines += _header('workua_conversations_active', 'gauge', "Незавершені діалоги ConversationHandler")
+    for handler in _conversation_handlers(application.handlers.get(0, [])):
+        # PTB не має публічного лічильника активних діалогів
+        lines.append(f'workua_conversations_active{{conversation="{handler.name}"}} {len(handler._conversations)}')
+
+    return '\n'.join(lines) + '\n'
+
+class MetricsServer:
+    """Мінімальний HTTP-сервер на asyncio для GET /metrics; працює в циклі подій бота"""
+
+    def __init__(self, application, engine, session_counts, host: str, port: int):
+        self.application = application
+        self.engine = engine
+        self.session_counts = session_counts
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logger.info(f"📈 Метрики: http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()).strip():
+                pass
+            
+            parts = request_line.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == 'GET' and parts[1] == '/metrics':
+                status = "200 OK"
+                body = render(self.application, self.engine, self.session_counts).encode('utf-8')
+            else:
+                status = "404 Not Found"
+                body = b"not found\n"
+            
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n".encode('latin-1') + body
+            )
+            await writer.drain()
+        except (ConnectionError, UnicodeDecodeError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,273 @@
+# outbound.py
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import deque
+from datetime import timedelta
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter
+
+logger = logging.getLogger(__name__)
+
+# Ліміти Telegram: до 30 повідомлень/с на бота і близько 1/с в один чат
+GLOBAL_RATE = 30
+PER_CHAT_RATE = 1.0
+PER_CHAT_BURST = 3
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+DEPTH_REPORT_INTERVAL = 30
+MESSAGE_LIMIT = 4096
+
+class TokenBucket:
+    """rate токенів за секунду, накопичується не більше burst"""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def delay(self, now: float) -> float:
+        """Скільки секунд чекати до наступного токена"""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        self._refill(now)
+        self.tokens -= 1
+
+    def is_full(self, now: float) -> bool:
+        self._refill(now)
+        return self.tokens >= self.burst
+
+class OutgoingMessage:
+    def __init__(self, text: str, kwargs: dict, future: asyncio.Future):
+        self.text = text
+        self.kwargs = kwargs
+        self.future = future
+
+class ChatQueue:
+    def __init__(self, rate: float, burst: float):
+        self.messages = deque()
+        self.bucket = TokenBucket(rate, burst)
+        self.scheduled = False
+        self.in_flight = False
+
+def _retry_after_seconds(retry_after) -> float:
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # Помилки доставки вже залоговані чергою; fan-out код може не чекати на Future
+    if not future.cancelled():
+        future.exception()
+
+class OutboundQueue:
+    """Центральна черга вихідних повідомлень з урахуванням загального ліміту та ліміту на чат.
+
+    Повідомлення одного чату йдуть строго по черзі, різних чатів — паралельно.
+    Кілька текстових повідомлень без кнопок, що чекають в одному чаті, склеюються в одне.
+    """
+
+    def __init__(self, bot, global_rate: float = GLOBAL_RATE, per_chat_rate: float = PER_CHAT_RATE,
+                 per_chat_burst: float = PER_CHAT_BURST, max_retries: int = MAX_RETRIES):
+        self.bot = bot
+        self.per_chat_rate = per_chat_rate
+        self.per_chat_burst = per_chat_burst
+        self.max_retries = max_retries
+        # Без накопичення: загальний ліміт рівномірний, навіть після паузи flood control
+        self._global = TokenBucket(global_rate, 1)
+        self._chats = {}
+        self._ready = []
+        self._order = itertools.count()
+        self._paused_until = 0.0
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._deliveries = set()
+        self._tasks = []
+        self.sent = 0
+        self.batched = 0
+        self.retried = 0
+        self.flood_waits = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._dispatch()),
+            asyncio.create_task(self._report_depth()),
+        ]
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Дочекатися відправки черги (не довше timeout) і зупинити фонові задачі"""
+        try:
+            await asyncio.wait_for(self.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"📤 Зупинка черги: не відправлено {self.depth()} повідомлень")
+        for task in self._tasks + list(self._deliveries):
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._deliveries, return_exceptions=True)
+        self._tasks = []
+
+    async def join(self) -> None:
+        """Дочекатися, поки черга спорожніє"""
+        await self._idle.wait()
+
+    def enqueue(self, chat_id: int, text: str, **kwargs) -> asyncio.Future:
+        """Поставити повідомлення в чергу, не чекаючи відправки; Future отримає Message"""
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve_exception)
+
+        chat = self._chats.get(chat_id)
+        if chat is None:
+            chat = self._chats[chat_id] = ChatQueue(self.per_chat_rate, self.per_chat_burst)
+        chat.messages.append(OutgoingMessage(text, kwargs, future))
+        if not chat.scheduled and not chat.in_flight:
+            self._schedule(chat_id, chat)
+        self._idle.clear()
+        return future
+
+    async def send(self, chat_id: int, text: str, **kwargs):
+        """Відправити через чергу і дочекатися результату"""
+        return await self.enqueue(chat_id, text, **kwargs)
+
+    def depth(self) -> int:
+        return sum(len(chat.messages) for chat in self._chats.values())
+
+    def stats(self) -> dict:
+        return {
+            'depth': self.depth(),
+            'chats_waiting': sum(1 for chat in self._chats.values() if chat.messages),
+            'in_flight': sum(1 for chat in self._chats.values() if chat.in_flight),
+            'sent': self.sent,
+            'batched': self.batched,
+            'retried': self.retried,
+            'flood_waits': self.flood_waits,
+            'failed': self.failed,
+        }
+
+    def _schedule(self, chat_id: int, chat: ChatQueue) -> None:
+        now = time.monotonic()
+        ready_at = now + chat.bucket.delay(now)
+        heapq.heappush(self._ready, (ready_at, next(self._order), chat_id))
+        chat.scheduled = True
+        self._wakeup.set()
+
+    async def _wait(self, timeout) -> None:
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _dispatch(self) -> None:
+        while True:
+            if not self._ready:
+                await self._wait(None)
+                continue
+
+            now = time.monotonic()
+            ready_at, _, chat_id = self._ready[0]
+            delay = max(ready_at - now, self._global.delay(now), self._paused_until - now)
+            if delay > 0:
+                await self._wait(delay)
+                continue
+
+            heapq.heappop(self._ready)
+            chat = self._chats[chat_id]
+            chat.scheduled = False
+            self._global.take(now)
+            chat.bucket.take(now)
+            chat.in_flight = True
+
+            delivery = asyncio.create_task(self._deliver(chat_id, chat, self._take_batch(chat)))
+            self._deliveries.add(delivery)
+            delivery.add_done_callback(self._deliveries.discard)
+
+    def _take_batch(self, chat: ChatQueue) -> list:
+        batch = [chat.messages.popleft()]
+        if batch[0].kwargs:
+            return batch
+
+        length = len(batch[0].text)
+        while chat.messages and not chat.messages[0].kwargs:
+            length += 2 + len(chat.messages[0].text)
+            if length > MESSAGE_LIMIT:
+                break
+            batch.append(chat.messages.popleft())
+        return batch
+
+    async def _deliver(self, chat_id: int, chat: ChatQueue, batch: list) -> None:
+        text = "\n\n".join(message.text for message in batch)
+        attempt = 0
+        try:
+            while True:
+                try:
+                    result = await self.bot.send_message(chat_id=chat_id, text=text, **batch[0].kwargs)
+                except RetryAfter as e:
+                    error = e
+                    wait = _retry_after_seconds(e.retry_after)
+                    self.flood_waits += 1
+                    self._paused_until = max(self._paused_until, time.monotonic() + wait)
+                    logger.warning(f"📤 Flood control Telegram: пауза {wait} с")
+                except (BadRequest, Forbidden) as e:
+                    self._fail(chat_id, batch, e)
+                    return
+                except NetworkError as e:
+                    error = e
+                    wait = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+                else:
+                    self.sent += 1
+                    self.batched += len(batch) - 1
+                    for message in batch:
+                        if not message.future.done():
+                            message.future.set_result(result)
+                    return
+
+                attempt += 1
+                if attempt > self.max_retries:
+                    self._fail(chat_id, batch, error)
+                    return
+                self.retried += 1
+                await asyncio.sleep(wait)
+        except Exception as e:
+            self._fail(chat_id, batch, e)
+            raise
+        finally:
+            chat.in_flight = False
+            if chat.messages:
+                self._schedule(chat_id, chat)
+            elif not self._ready and not any(c.in_flight for c in self._chats.values()):
+                self._idle.set()
+
+    def _fail(self, chat_id: int, batch: list, error: Exception) -> None:
+        self.failed += len(batch)
+        logger.error(f"Не вдалося відправити повідомлення в чат {chat_id}: {error}")
+        for message in batch:
+            if not message.future.done():
+                message.future.set_exception(error)
+
+    async def _report_depth(self) -> None:
+        while True:
+            await asyncio.sleep(DEPTH_REPORT_INTERVAL)
+            now = time.monotonic()
+            for chat_id, chat in list(self._chats.items()):
+                if not chat.messages and not chat.scheduled and not chat.in_flight and chat.bucket.is_full(now):
+                    del self._chats[chat_id]
+
+            stats = self.stats()
+            if stats['depth']:
+                logger.info(
+                    f"📤 Черга повідомлень: {stats['depth']} у {stats['chats_waiting']} чатах, "
+                    f"відправлено {stats['sent']}, повторів {stats['retried']}, помилок {stats['failed']}"
+                )
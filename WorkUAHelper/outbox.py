@@ -0,0 +1,140 @@
+# outbox.py
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from sqlalchemy.dialects.sqlite import insert
+from telegram.error import BadRequest, Forbidden
+from database import Session, OutboxMessage, run_db
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+POLL_INTERVAL = 5
+MAX_ATTEMPTS = 6
+RETRY_BASE = timedelta(seconds=30)
+RETRY_MAX = timedelta(hours=1)
+# Стільки зберігаються відправлені записи, а з ними й ключі ідемпотентності
+SENT_RETENTION = timedelta(days=7)
+
+def add_notification(db_session, idempotency_key: str, chat_id: int, text: str) -> None:
+    """Записати сповіщення в outbox у поточній транзакції; повторний ключ ігнорується.
+
+    SQLite повторно використовує id видалених рядків, тому ключ має містити ще й час створення запису.
+    """
+    db_session.execute(
+        insert(OutboxMessage).values(
+            idempotency_key=idempotency_key,
+            chat_id=chat_id,
+            text=text
+        ).on_conflict_do_nothing(index_elements=['idempotency_key'])
+    )
+
+def due_messages(db_session, limit: int):
+    return db_session.query(OutboxMessage).filter(
+        OutboxMessage.status == "pending",
+        OutboxMessage.next_attempt_at <= datetime.utcnow()
+    ).order_by(OutboxMessage.next_attempt_at, OutboxMessage.id).limit(limit).all()
+
+def _record_results(db_session, outcomes):
+    now = datetime.utcnow()
+    messages = {
+        message.id: message
+        for message in db_session.query(OutboxMessage).filter(OutboxMessage.id.in_([message_id for message_id, _ in outcomes]))
+    }
+    
+    for message_id, result in outcomes:
+        message = messages[message_id]
+        if not isinstance(result, Exception):
+            message.status = "sent"
+            message.sent_at = now
+            continue
+        
+        message.attempts += 1
+        message.last_error = str(result)[:500]
+        if isinstance(result, (BadRequest, Forbidden)) or message.attempts >= MAX_ATTEMPTS:
+            message.status = "dead"
+            logger.error(f"Сповіщення {message.idempotency_key} переміщено в dead letter: {result}")
+        else:
+            message.next_attempt_at = now + min(RETRY_MAX, RETRY_BASE * 2 ** (message.attempts - 1))
+    
+    db_session.query(OutboxMessage).filter(
+        OutboxMessage.status == "sent",
+        OutboxMessage.sent_at < now - SENT_RETENTION
+    ).delete(synchronize_session=False)
+    db_session.commit()
+
+class OutboxWorker:
+    """Фоновий обробник outbox: відправляє сповіщення пачками через OutboundQueue.
+
+    Запис позначається відправленим лише після відповіді Telegram, тож після збою
+    сповіщення буде відправлено повторно, але не загублено.
+    """
+
+    def __init__(self, queue, batch_size: int = BATCH_SIZE, poll_interval: float = POLL_INTERVAL):
+        self.queue = queue
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Дати поточній пачці завершитися і зупинитися"""
+        self._stopping = True
+        self.wake()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("📬 Outbox не встиг завершити пачку, решту буде відправлено після перезапуску")
+
+    def wake(self) -> None:
+        """Обробники викликають після коміту, щоб не чекати на наступне опитування"""
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                delivered = await self.drain_once()
+            except Exception as e:
+                logger.error(f"Помилка обробки outbox: {e}")
+                delivered = 0
+            
+            if delivered < self.batch_size and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def drain_once(self) -> int:
+        """Відправити одну пачку сповіщень, час яких настав; повертає їх кількість"""
+        batch = await run_db(due_messages, self.batch_size)
+        if not batch:
+            return 0
+        
+        results = await asyncio.gather(
+            *(self.queue.send(message.chat_id, message.text) for message in batch),
+            return_exceptions=True
+        )
+        await run_db(_record_results, [(message.id, result) for message, result in zip(batch, results)], write=True)
+        return len(batch)
+
+def retry_dead_letters() -> int:
+    """Повернути сповіщення з dead letter у чергу"""
+    db_session = Session()
+    count = db_session.query(OutboxMessage).filter_by(status="dead").update({
+        OutboxMessage.status: "pending",
+        OutboxMessage.attempts: 0,
+        OutboxMessage.next_attempt_at: datetime.utcnow()
+    })
+    db_session.commit()
+    db_session.close()
+    return count
+
+if __name__ == '__main__':
+    import sys
+    if sys.argv[1:] == ['retry-dead']:
+        print(f"✅ Повернуто в чергу сповіщень: {retry_dead_letters()}")
@@ -0,0 +1,63 @@
+# profiles.py
+from collections import namedtuple
+from datetime import datetime
+from cache import LRUCache
+from config import Config
+from database import User, Vacancy, Resume, Application, run_db
+
+UserProfile = namedtuple('UserProfile', 'telegram_id username full_name phone email is_employer registration_date')
+
+profile_cache = LRUCache(Config.PROFILE_CACHE_SIZE, Config.PROFILE_CACHE_TTL)
+
+def _load_profile(db_session, telegram_id):
+    user = db_session.query(User).filter_by(telegram_id=telegram_id).first()
+    if not user:
+        return None
+    return UserProfile(
+        user.telegram_id, user.username, user.full_name, user.phone, user.email,
+        bool(user.is_employer), user.registration_date
+    )
+
+async def get_profile(telegram_id: int):
+    """Профіль користувача з кешу або з БД; None, якщо користувач не зареєстрований"""
+    profile = profile_cache.get(telegram_id)
+    if profile is None:
+        profile = await run_db(_load_profile, telegram_id)
+        # Незареєстрованих не кешуємо: наступний /start одразу їх створить
+        if profile is not None:
+            profile_cache.put(telegram_id, profile)
+    return profile
+
+def save_user_role(db_session, user, is_employer: bool) -> bool:
+    """Зареєструвати користувача або змінити його роль; повертає True для нового користувача"""
+    existing_user = db_session.query(User).filter_by(telegram_id=user.id).first()
+
+    if not existing_user:
+        new_user = User(
+            telegram_id=user.id,
+            username=user.username,
+            full_name=user.full_name,
+            is_employer=is_employer,
+            registration_date=datetime.utcnow()
+        )
+        db_session.add(new_user)
+        db_session.commit()
+        return True
+
+    existing_user.is_employer = is_employer
+    db_session.commit()
+    return False
+
+def invalidate_profile(telegram_id: int) -> None:
+    """Викликати після кожного запису в users для цього telegram_id"""
+    profile_cache.invalidate(telegram_id)
+
+def delete_user_data(db_session, telegram_id: int):
+    """Видалити користувача з вакансіями, резюме й заявками без commit; повертає id видалених вакансій"""
+    vacancy_ids = [row.id for row in db_session.query(Vacancy.id).filter_by(employer_id=telegram_id)]
+    db_session.query(Vacancy).filter_by(employer_id=telegram_id).delete()
+    db_session.query(Resume).filter_by(user_id=telegram_id).delete()
+    db_session.query(Application).filter_by(user_id=telegram_id).delete()
+    db_session.query(Application).filter_by(employer_id=telegram_id).delete()
+    db_session.query(User).filter_by(telegram_id=telegram_id).delete()
+    return vacancy_ids
@@ -0,0 +1,40 @@
+# routes.py
+AWAITING_INPUT = 'awaiting_input'
+
+def expect_input(context, state: str) -> None:
+    """Наступне текстове повідомлення користувача піде обробнику вводу state"""
+    context.user_data[AWAITING_INPUT] = state
+
+class Router:
+    """Маршрутизація текстових повідомлень: підпис кнопки меню -> обробник.
+
+    Очікуваний ввід (наприклад, пошуковий запит) має пріоритет над кнопками
+    і скидається після першого ж повідомлення.
+    """
+
+    def __init__(self, fallback):
+        self.routes = {}
+        self.input_handlers = {}
+        self.fallback = fallback
+
+    def add(self, label: str, handler) -> None:
+        if label in self.routes:
+            raise ValueError(f"Кнопку '{label}' вже зареєстровано")
+        self.routes[label] = handler
+
+    def add_input(self, state: str, handler) -> None:
+        """handler(update, context, text) отримає повідомлення після expect_input(context, state)"""
+        if state in self.input_handlers:
+            raise ValueError(f"Обробник вводу '{state}' вже зареєстровано")
+        self.input_handlers[state] = handler
+
+    def resolve(self, text: str, user_data: dict):
+        """Обробник і додаткові аргументи для повідомлення text"""
+        state = user_data.pop(AWAITING_INPUT, None)
+        if state in self.input_handlers:
+            return self.input_handlers[state], (text,)
+        return self.routes.get(text, self.fallback), ()
+
+    async def dispatch(self, update, context) -> None:
+        handler, args = self.resolve(update.message.text, context.user_data)
+        await handler(update, context, *args)
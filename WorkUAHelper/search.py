@@ -0,0 +1,76 @@
+# search.py
+import re
+from sqlalchemy import table, column, literal_column, func, or_, and_
+from database import User, Vacancy, Resume
+
+vacancies_fts = table('vacancies_fts', column('rowid'))
+resumes_fts = table('resumes_fts', column('rowid'))
+
+# Ваги BM25 у порядку колонок FTS-індексу (див. database.SEARCH_INDEXES)
+VACANCY_WEIGHTS = (10.0, 4.0, 1.0, 2.0)
+RESUME_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+
+# Бонус за свіжість: кожен день новизни важить як 0.02 бала BM25
+FRESHNESS_PER_DAY = 0.02
+FRESHNESS_EPOCH = '2025-01-01'
+
+def build_match_query(search_term: str) -> str:
+    """Перетворити запит користувача на префіксний FTS5-запит"""
+    tokens = re.findall(r'\w+', search_term.lower())
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+def encode_cursor(score: float, row_id: int) -> str:
+    return f"{score!r}_{row_id}"
+
+def decode_cursor(value: str):
+    score, row_id = value.rsplit('_', 1)
+    return float(score), int(row_id)
+
+def _score(fts_name, weights, created_at):
+    bm25 = func.bm25(literal_column(fts_name), *weights)
+    freshness = FRESHNESS_PER_DAY * (func.julianday(created_at) - func.julianday(FRESHNESS_EPOCH))
+    return func.round(bm25 - freshness, 6)
+
+def _after_cursor(score, id_column, cursor):
+    last_score, last_id = cursor
+    return or_(score > last_score, and_(score == last_score, id_column > last_id))
+
+def rank_vacancies(db_session, search_term: str, limit: int, cursor=None):
+    """Повернути до limit пар (вакансія, бал) після курсора, найрелевантніші першими"""
+    match_query = build_match_query(search_term)
+    if not match_query:
+        return []
+
+    score = _score('vacancies_fts', VACANCY_WEIGHTS, Vacancy.created_at)
+    query = db_session.query(Vacancy, score).join(
+        vacancies_fts, vacancies_fts.c.rowid == Vacancy.id
+    ).filter(
+        literal_column('vacancies_fts').match(match_query)
+    ).filter(
+        Vacancy.is_active == True
+    )
+    if cursor:
+        query = query.filter(_after_cursor(score, Vacancy.id, cursor))
+
+    return query.order_by(score, Vacancy.id).limit(limit).all()
+
+def rank_candidates(db_session, search_term: str, limit: int, cursor=None):
+    """Повернути до limit трійок (резюме, ім'я кандидата, бал) після курсора"""
+    match_query = build_match_query(search_term)
+    if not match_query:
+        return []
+
+    score = _score('resumes_fts', RESUME_WEIGHTS, Resume.created_at)
+    query = db_session.query(Resume, User.full_name, score).join(
+        resumes_fts, resumes_fts.c.rowid == Resume.id
+    ).outerjoin(
+        User, User.telegram_id == Resume.user_id
+    ).filter(
+        literal_column('resumes_fts').match(match_query)
+    ).filter(
+        Resume.is_active == True
+    )
+    if cursor:
+        query = query.filter(_after_cursor(score, Resume.id, cursor))
+
+    return query.order_by(score, Resume.id).limit(limit).all()
@@ -0,0 +1,231 @@
+# seed.py
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, bindparam
+from database import (
+    Base, User, Vacancy, Resume, ResumeSnapshot, Application, ApplicationStatus,
+    create_sqlite_engine, run_migrations, create_search_index, encode_resume_snapshot
+)
+
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+CHUNK_SIZE = 5000
+
+# Детерміновані дані: той самий масштаб і seed дають ту саму базу на будь-якому коміті
+SEED_EPOCH = datetime(2025, 6, 1)
+SEED_PERIOD_DAYS = 180
+
+EMPLOYER_BASE_ID = 400_000_000
+SEEKER_BASE_ID = 500_000_000
+
+TITLES = [
+    "Python розробник", "Java розробник", "Frontend розробник", "QA інженер", "DevOps інженер",
+    "Data Scientist", "Project Manager", "UI/UX дизайнер", "Бухгалтер", "Менеджер з продажу",
+    "HR менеджер", "Маркетолог", "Адміністратор", "Водій", "Кухар", "Продавець-консультант",
+    "Логіст", "Юрист", "Системний адміністратор", "Аналітик даних",
+]
+LEVELS = ["Junior", "Middle", "Senior", "Lead", ""]
+COMPANIES = [
+    "TechSoft Ukraine", "DataPro", "ПриватБанк", "Нова Пошта", "Епіцентр", "Rozetka", "SoftServe",
+    "EPAM Ukraine", "GlobalLogic", "Сільпо", "Київстар", "monobank", "MacPaw", "Grammarly", "Укрзалізниця",
+]
+CITIES = ["Київ", "Львів", "Харків", "Одеса", "Дніпро", "Вінниця", "Запоріжжя", "Віддалено"]
+CATEGORIES = ["IT", "Фінанси", "Продажі", "Маркетинг", "Логістика", "Адміністрування", "Сфера послуг"]
+SKILLS = [
+    "Python", "Django", "SQL", "PostgreSQL", "Docker", "Kubernetes", "JavaScript", "React", "Java",
+    "Spring", "Excel", "1С", "Figma", "англійська B2", "переговори", "CRM", "Linux", "AWS", "Git",
+]
+UNIVERSITIES = ["КПІ", "КНУ ім. Шевченка", "Львівська політехніка", "ХНУРЕ", "ОНПУ", "ДНУ"]
+FIRST_NAMES = ["Іван", "Олена", "Андрій", "Марія", "Дмитро", "Оксана", "Сергій", "Наталія", "Максим", "Юлія"]
+LAST_NAMES = ["Петренко", "Коваленко", "Шевченко", "Бондаренко", "Ткаченко", "Кравченко", "Мельник", "Бойко"]
+
+STATUSES = [ApplicationStatus.NEW] * 6 + [ApplicationStatus.VIEWED] * 3 + [ApplicationStatus.REJECTED]
+
+def scale_counts(size: int) -> dict:
+    """Скільки рядків кожного виду створює масштаб"""
+    return {
+        'employers': max(size // 100, 10),
+        'seekers': size,
+        'vacancies': size,
+    }
+
+def _created_at(rng: random.Random) -> datetime:
+    return SEED_EPOCH - timedelta(seconds=rng.randrange(SEED_PERIOD_DAYS * 24 * 3600))
+
+def _full_name(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+def _phone(rng: random.Random) -> str:
+    return f"+38050{rng.randrange(10_000_000):07d}"
+
+def vacancy_employer_id(vacancy_id: int, employers: int) -> int:
+    return EMPLOYER_BASE_ID + vacancy_id % employers
+
+def _employer_rows(rng: random.Random, employers: int):
+    for number in range(employers):
+        yield {
+            'telegram_id': EMPLOYER_BASE_ID + number,
+            'username': f"employer{number}",
+            'full_name': _full_name(rng),
+            'phone': _phone(rng),
+            'email': f"hr{number}@example.com",
+            'is_employer': True,
+            'registration_date': _created_at(rng),
+        }
+
+def _vacancy_rows(rng: random.Random, vacancies: int, employers: int):
+    for vacancy_id in range(1, vacancies + 1):
+        title = f"{rng.choice(LEVELS)} {rng.choice(TITLES)}".strip()
+        skills = ', '.join(rng.sample(SKILLS, 3))
+        row = {
+            'id': vacancy_id,
+            'title': title,
+            'company': rng.choice(COMPANIES),
+            'salary': f"{rng.randrange(500, 6000, 100)}$",
+            'description': f"{title} у місті {rng.choice(CITIES)}. Робота в команді, офіційне працевлаштування, навчання за рахунок компанії.",
+            'requirements': f"Досвід від {rng.randint(0, 5)} років, {skills}",
+            'contacts': f"hr{vacancy_id % employers}@example.com",
+            'category': rng.choice(CATEGORIES),
+            'is_active': rng.random() < 0.9,
+            'employer_id': vacancy_employer_id(vacancy_id, employers),
+            'created_at': _created_at(rng),
+        }
+        row['updated_at'] = row['created_at']
+        yield row
+
+def _seeker_rows(rng: random.Random, seekers: int, vacancies: int, employers: int):
+    """Користувач, його резюме та заявки — разом, щоб не тримати всі резюме в пам'яті"""
+    for number in range(seekers):
+        telegram_id = SEEKER_BASE_ID + number
+        full_name = _full_name(rng)
+        phone = _phone(rng)
+        registered_at = _created_at(rng)
+        user = {
+            'telegram_id': telegram_id,
+            'username': f"seeker{number}",
+            'full_name': full_name,
+            'phone': phone,
+            'email': f"seeker{number}@example.com",
+            'is_employer': False,
+            'registration_date': registered_at,
+        }
+
+        resume = {
+            'user_id': telegram_id,
+            'position': rng.choice(TITLES),
+            'salary': f"{rng.randrange(500, 6000, 100)}$",
+            'experience': f"{rng.randint(0, 10)} роки | {rng.choice(COMPANIES)}",
+            'education': rng.choice(UNIVERSITIES),
+            'skills': ', '.join(rng.sample(SKILLS, 4)),
+            'about': "Відповідальний, швидко навчаюся, шукаю роботу в сильній команді.",
+            'contacts': f"{full_name}, {phone}, seeker{number}@example.com",
+            'is_active': True,
+            'created_at': registered_at,
+        }
+
+        content_hash, payload = encode_resume_snapshot(resume['position'], resume['experience'], resume['education'], resume['skills'])
+        snapshot = {'content_hash': content_hash, 'payload': payload, 'created_at': registered_at}
+        applications = [
+            {
+                'user_id': telegram_id,
+                'vacancy_id': vacancy_id,
+                'employer_id': vacancy_employer_id(vacancy_id, employers),
+                'resume_hash': content_hash,
+                'user_contacts': resume['contacts'],
+                'status': rng.choice(STATUSES),
+                'created_at': registered_at + timedelta(seconds=rng.randrange(7 * 24 * 3600)),
+            }
+            for vacancy_id in rng.sample(range(1, vacancies + 1), min(rng.randint(0, 4), vacancies))
+        ]
+        for application in applications:
+            application['updated_at'] = application['created_at']
+        yield user, resume, snapshot, applications
+
+def _insert(bench_engine, table, rows) -> int:
+    if rows:
+        with bench_engine.begin() as connection:
+            connection.execute(insert(table), rows)
+    return len(rows)
+
+# Однакові резюме різних шукачів зберігаються одним знімком, заявки посилаються на нього за хешем
+SNAPSHOT_INSERT = insert(ResumeSnapshot.__table__).prefix_with('OR IGNORE')
+APPLICATION_INSERT = insert(Application.__table__).values(
+    resume_snapshot_id=select(ResumeSnapshot.id).where(
+        ResumeSnapshot.content_hash == bindparam('resume_hash')
+    ).scalar_subquery()
+)
+
+def _insert_seekers(bench_engine, inserted: dict, users, resumes, snapshots, applications) -> None:
+    inserted['users'] += _insert(bench_engine, User.__table__, users)
+    inserted['resumes'] += _insert(bench_engine, Resume.__table__, resumes)
+    if snapshots:
+        with bench_engine.begin() as connection:
+            inserted['resume_snapshots'] += connection.execute(SNAPSHOT_INSERT, snapshots).rowcount
+            connection.execute(APPLICATION_INSERT, applications)
+        inserted['applications'] += len(applications)
+
+def seed_database(bench_engine, size: int, chunk_size: int = CHUNK_SIZE, seed: int = 42) -> dict:
+    """Наповнити базу синтетичними користувачами, вакансіями, резюме та заявками пачками по chunk_size"""
+    rng = random.Random(seed)
+    counts = scale_counts(size)
+    inserted = {'users': 0, 'vacancies': 0, 'resumes': 0, 'resume_snapshots': 0, 'applications': 0}
+
+    Base.metadata.create_all(bench_engine)
+    run_migrations(bench_engine)
+
+    for table, key, rows in (
+        (User.__table__, 'users', _employer_rows(rng, counts['employers'])),
+        (Vacancy.__table__, 'vacancies', _vacancy_rows(rng, counts['vacancies'], counts['employers'])),
+    ):
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                inserted[key] += _insert(bench_engine, table, chunk)
+                chunk = []
+        inserted[key] += _insert(bench_engine, table, chunk)
+
+    users, resumes, snapshots, applications = [], [], [], []
+    for user, resume, snapshot, user_applications in _seeker_rows(rng, counts['seekers'], counts['vacancies'], counts['employers']):
+        users.append(user)
+        resumes.append(resume)
+        if user_applications:
+            snapshots.append(snapshot)
+        applications.extend(user_applications)
+        if len(users) >= chunk_size:
+            _insert_seekers(bench_engine, inserted, users, resumes, snapshots, applications)
+            users, resumes, snapshots, applications = [], [], [], []
+    _insert_seekers(bench_engine, inserted, users, resumes, snapshots, applications)
+
+    # Повнотекстовий індекс заповнюється одним проходом після вставки, а не тригером на кожен рядок
+    create_search_index(bench_engine)
+    return inserted
+
+def main():
+    parser = argparse.ArgumentParser(description="Генерація синтетичних даних для навантажувальних тестів")
+    parser.add_argument('--scale', choices=SCALES, default='10k')
+    parser.add_argument('--database', required=True, help="шлях до нової бази SQLite")
+    parser.add_argument('--profile', choices=['default', 'tuned'], default='tuned')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if os.path.exists(args.database):
+        raise SystemExit(f"❌ {args.database} вже існує; генератор заповнює лише нову базу")
+
+    bench_engine = create_sqlite_engine(args.database, args.profile)
+    started = time.perf_counter()
+    inserted = seed_database(bench_engine, SCALES[args.scale], args.chunk_size, args.seed)
+    elapsed = time.perf_counter() - started
+    bench_engine.dispose()
+
+    print(f"\n🌱 Масштаб {args.scale}: {args.database}")
+    for table, count in inserted.items():
+        print(f"  {table:<14}{count:>10}")
+    print(f"⏱ {elapsed:.1f} с, {sum(inserted.values()) / elapsed:.0f} рядків/с")
+
+if __name__ == '__main__':
+    main()
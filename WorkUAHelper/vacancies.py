@@ -0,0 +1,40 @@
+# vacancies.py
+from sqlalchemy import func
+from database import Vacancy, Application
+import feed
+from outbox import add_notification
+
+def owner_vacancies(db_session, employer_id: int):
+    return db_session.query(Vacancy).filter_by(employer_id=employer_id).order_by(Vacancy.created_at.desc()).all()
+
+def employer_stats(db_session, employer_id: int):
+    """(кількість вакансій, кількість заявок на них) за лічильниками вакансій"""
+    return db_session.query(
+        func.count(Vacancy.id), func.coalesce(func.sum(Vacancy.applications_count), 0)
+    ).filter(Vacancy.employer_id == employer_id).one()
+
+def delete_vacancy(db_session, vacancy_id: int, employer_id: int):
+    """Видалити вакансію роботодавця разом із заявками без commit; кандидатам іде сповіщення через outbox.
+
+    Повертає (вакансія, id кандидатів) або (None, []), якщо вакансія не його.
+    """
+    vacancy = db_session.query(Vacancy).filter_by(id=vacancy_id, employer_id=employer_id).first()
+    if not vacancy:
+        return None, []
+
+    applicant_ids = [row.user_id for row in db_session.query(Application.user_id).filter_by(vacancy_id=vacancy_id)]
+
+    if applicant_ids:
+        notification_message = (
+            f"ℹ️ Інформація про вашу заявку:\n\n"
+            f"🏢 Вакансія: {vacancy.title}\n"
+            f"🏭 Компанія: {vacancy.company}\n"
+            f"📊 Статус: ❌ Вакансію видалено\n\n"
+            f"Роботодавець видалив цю вакансію. Ваша заявка більше не розглядається."
+        )
+        for applicant_id in applicant_ids:
+            add_notification(db_session, f"vacancy-deleted:{feed.encode_cursor(vacancy)}:{applicant_id}", applicant_id, notification_message)
+        db_session.query(Application).filter_by(vacancy_id=vacancy_id).delete()
+
+    db_session.delete(vacancy)
+    return vacancy, applicant_ids